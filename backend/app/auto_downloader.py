@@ -5,11 +5,11 @@ from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from sqlmodel import Session, select
 
-from .database import engine
+from .database import open_session
 from .models import DownloadJob, Magazine
 from .sabnzbd import SabnzbdConnection, SabnzbdError, SabnzbdNotConfigured, enqueue_url, is_configured
 from .schemas import SearchResult
-from .services import get_sabnzbd_connection, search_magazines, upsert_download_job
+from .services import get_sabnzbd_connection, search_magazines, upsert_download_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +104,7 @@ class AutoDownloader:
 
     async def _sync_once(self) -> int:
         async with self._scan_lock:
-            with Session(engine) as session:
+            with open_session() as session:
                 connection: Optional[SabnzbdConnection] = get_sabnzbd_connection(session)
                 if not is_configured(connection):
                     raise SabnzbdNotConfigured("SABnzbd connection missing.")
@@ -149,20 +149,19 @@ class AutoDownloader:
             "issue_month": result.issue_month,
             "issue_number": result.issue_number,
         }
-        for nzo_id in sab_result.nzo_ids:
-            upsert_download_job(
-                session,
-                nzo_id=nzo_id,
-                title=result.title,
-                magazine_title=result.magazine_title,
-                link=str(result.link),
-                status="queued",
-                issue_code=metadata["issue_code"],
-                issue_label=metadata["issue_label"],
-                issue_year=metadata["issue_year"],
-                issue_month=metadata["issue_month"],
-                issue_number=metadata["issue_number"],
-            )
+        upsert_download_jobs(
+            session,
+            sab_result.nzo_ids,
+            title=result.title,
+            magazine_title=result.magazine_title,
+            link=str(result.link),
+            status="queued",
+            issue_code=metadata["issue_code"],
+            issue_label=metadata["issue_label"],
+            issue_year=metadata["issue_year"],
+            issue_month=metadata["issue_month"],
+            issue_number=metadata["issue_number"],
+        )
         logger.info(
             "Auto downloaded %s from %s (issue_code=%s)",
             result.title,
@@ -1,12 +1,16 @@
+from datetime import datetime
 from typing import Iterator
 
+from sqlalchemy import event
 from sqlalchemy.exc import OperationalError
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, select
 
+from .models import AppConfig, match_stem
 from .settings import get_settings
 
 
 settings = get_settings()
+settings.ensure_sqlite_directory()
 engine = create_engine(
     settings.database_url,
     echo=False,
@@ -14,16 +18,36 @@ engine = create_engine(
 )
 
 
+if settings.database_url.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite_connection(dbapi_connection, _connection_record) -> None:
+        # WAL + NORMAL sync: commits no longer fsync the main database file each time.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
 def init_db() -> None:
     SQLModel.metadata.create_all(engine)
     _ensure_language_column()
     _ensure_magazine_interval_columns()
     _ensure_download_job_columns()
     _ensure_app_config_columns()
+    _normalize_auto_download_interval()
+    _ensure_indexes()
+    _backfill_download_job_stems()
+
+
+def open_session() -> Session:
+    # Keep attributes loaded after commit so write helpers need no refresh SELECT
+    # and returned rows stay readable once the session is closed.
+    return Session(engine, expire_on_commit=False)
 
 
 def get_session() -> Iterator[Session]:
-    with Session(engine) as session:
+    with open_session() as session:
         yield session
 
 
@@ -51,6 +75,9 @@ def _ensure_download_job_columns() -> None:
         "issue_year": "INTEGER",
         "issue_month": "INTEGER",
         "issue_number": "INTEGER",
+        "clean_stem": "TEXT",
+        "content_stem": "TEXT",
+        "title_stem": "TEXT",
     }
     for column, ddl_type in columns.items():
         try:
@@ -96,3 +123,54 @@ def _ensure_app_config_columns() -> None:
                 connection.exec_driver_sql(f"ALTER TABLE appconfig ADD COLUMN {column} {ddl_type}")
         except OperationalError:
             continue
+
+
+def _normalize_auto_download_interval() -> None:
+    # Older releases stored the interval in seconds; API validation now caps it at 24 hours.
+    # Runs for every dialect, so it goes through the ORM rather than SQLite-specific SQL.
+    with open_session() as session:
+        configs = session.exec(select(AppConfig).where(AppConfig.auto_download_interval > 48)).all()
+        if not configs:
+            return
+        now = datetime.utcnow()
+        for config in configs:
+            config.auto_download_interval = round(config.auto_download_interval / 3600.0, 4)
+            config.updated_at = now
+            session.add(config)
+        session.commit()
+
+
+def _ensure_indexes() -> None:
+    if not settings.database_url.startswith("sqlite"):
+        return
+    indexes = {
+        "ix_magazine_status": "magazine (status)",
+        "ix_downloadjob_status": "downloadjob (status)",
+        "ix_downloadjob_created_at": "downloadjob (created_at)",
+        "ix_downloadjob_clean_stem": "downloadjob (clean_stem)",
+        "ix_downloadjob_content_stem": "downloadjob (content_stem)",
+        "ix_downloadjob_title_stem": "downloadjob (title_stem)",
+    }
+    with engine.begin() as connection:
+        for name, target in indexes.items():
+            connection.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+
+def _backfill_download_job_stems() -> None:
+    if not settings.database_url.startswith("sqlite"):
+        return
+    with engine.begin() as connection:
+        rows = connection.exec_driver_sql(
+            "SELECT id, clean_name, content_name, title FROM downloadjob "
+            "WHERE clean_stem IS NULL AND content_stem IS NULL AND title_stem IS NULL "
+            "AND (clean_name IS NOT NULL OR content_name IS NOT NULL OR title IS NOT NULL)"
+        ).all()
+        if not rows:
+            return
+        connection.exec_driver_sql(
+            "UPDATE downloadjob SET clean_stem = ?, content_stem = ?, title_stem = ? WHERE id = ?",
+            [
+                (match_stem(clean_name), match_stem(content_name), match_stem(title), job_id)
+                for job_id, clean_name, content_name, title in rows
+            ],
+        )
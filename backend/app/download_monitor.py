@@ -6,9 +6,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Literal, Optional
 
-from sqlmodel import Session
 
-from .database import engine
+from .database import open_session
 from .download_processor import process_download_entry
 from .models import DownloadJob
 from .services import find_download_job_for_entry, mark_download_job_moved
@@ -16,7 +15,7 @@ from .services import find_download_job_for_entry, mark_download_job_moved
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonitorConfig:
     source_dir: Path
     target_dir: Path
@@ -97,9 +96,13 @@ class DownloadMonitor:
             raise
 
     async def _ensure_directories(self) -> None:
-        for path in (self.config.source_dir, self.config.target_dir, self.config.staging_dir, self.cover_dir):
-            if path and not path.exists():
-                path.mkdir(parents=True, exist_ok=True)
+        paths = [
+            path
+            for path in (self.config.source_dir, self.config.target_dir, self.config.staging_dir, self.cover_dir)
+            if path
+        ]
+        # Independent blocking mkdirs: run them side by side, off the event loop.
+        await asyncio.gather(*(asyncio.to_thread(_ensure_directory, path) for path in paths))
 
     async def _scan_once(self) -> None:
         source = self.config.source_dir
@@ -122,7 +125,7 @@ class DownloadMonitor:
             self._move_entry(entry)
 
     def _move_entry(self, entry: Path) -> None:
-        with Session(engine) as session:
+        with open_session() as session:
             job = find_download_job_for_entry(session, entry.name)
             if not job:
                 logger.debug("Skipping %s: no matching Gazarr download job.", entry)
@@ -187,7 +190,7 @@ class DownloadMonitor:
 
     def _record_move(self, job_id: int, destination: Path) -> None:
         try:
-            with Session(engine) as session:
+            with open_session() as session:
                 job = session.get(DownloadJob, job_id)
                 if not job:
                     logger.warning("Unable to record move for job id %s; job missing.", job_id)
@@ -197,6 +200,11 @@ class DownloadMonitor:
             logger.exception("Failed to update download job for %s", job_id)
 
 
+def _ensure_directory(path: Path) -> None:
+    if not path.exists():
+        path.mkdir(parents=True, exist_ok=True)
+
+
 def _entry_is_ready(path: Path, settle_seconds: float) -> bool:
     try:
         stat = path.stat()
@@ -12,7 +12,7 @@ import fitz  # type: ignore[import]
 from pypdf import PdfReader, PdfWriter
 from sqlmodel import Session, select
 
-from .database import engine
+from .database import open_session
 from .models import DownloadJob, Magazine
 from .services import update_download_job_status
 
@@ -43,7 +43,7 @@ def process_download_entry(
     issue_month: Optional[int] = None
     issue_number: Optional[int] = None
     issue_label: Optional[str] = None
-    with Session(engine) as session:
+    with open_session() as session:
         job = session.get(DownloadJob, job_id)
         if not job:
             raise ValueError(f"No download job found for id {job_id}")
@@ -115,7 +115,7 @@ def process_download_entry(
         except Exception:  # pragma: no cover - defensive logging
             logger.exception("Failed processing PDF metadata for %s", pdf_file)
 
-    with Session(engine) as session:
+    with open_session() as session:
         job = session.get(DownloadJob, job_id)
         if job:
             update_download_job_status(
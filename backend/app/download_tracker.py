@@ -6,17 +6,19 @@ from typing import Optional
 
 from sqlmodel import Session
 
-from .database import engine
+from .database import open_session
 from .sabnzbd import (
     SabnzbdConnection,
     SabnzbdError,
     SabnzbdNotConfigured,
     fetch_history,
     fetch_queue,
+    fetch_queue_and_history,
 )
 from .services import (
     get_app_config,
     get_sabnzbd_connection,
+    has_active_download_jobs,
     list_active_download_jobs,
     mark_download_job_failed,
     update_download_job_status,
@@ -40,6 +42,7 @@ class DownloadTracker:
         self.config = config
         self._task: Optional[asyncio.Task[None]] = None
         self._stop_event = asyncio.Event()
+        self._last_queue_size = 0
 
     def start(self) -> None:
         if self._task and not self._task.done():
@@ -94,23 +97,31 @@ class DownloadTracker:
             raise
 
     async def _sync_once(self) -> None:
-        with Session(engine) as session:
-            jobs = list_active_download_jobs(session)
-            if not jobs:
+        with open_session() as session:
+            if not has_active_download_jobs(session):
                 return
             connection: Optional[SabnzbdConnection] = get_sabnzbd_connection(session)
             if not connection:
                 raise SabnzbdNotConfigured("SABnzbd connection missing.")
             app_config = get_app_config(session)
 
-        queue_items = await fetch_queue(connection)
-        history_items = await fetch_history(connection, limit=max(self.config.history_limit, len(queue_items) + 20))
+        history_limit = self.config.history_limit
+        if self._last_queue_size + 20 > history_limit:
+            # Busy queue: size the history window from it so recently finished jobs aren't missed.
+            queue_items = await fetch_queue(connection)
+            history_items = await fetch_history(connection, limit=max(history_limit, len(queue_items) + 20))
+        else:
+            queue_items, history_items = await fetch_queue_and_history(connection, limit=history_limit)
+            if len(queue_items) + 20 > history_limit:
+                # The queue just grew past the window; widen it this once.
+                history_items = await fetch_history(connection, limit=len(queue_items) + 20)
+        self._last_queue_size = len(queue_items)
         queue_map = {item.nzo_id: item for item in queue_items if item.nzo_id}
         history_map = {item.nzo_id: item for item in history_items if item.nzo_id}
         if self.config.debug_logging:
             self._log_debug_snapshot(queue_items, history_items)
 
-        with Session(engine) as session:
+        with open_session() as session:
             for job in list_active_download_jobs(session):
                 nzo_id = job.sabnzbd_id
                 if not nzo_id:
@@ -144,6 +155,7 @@ class DownloadTracker:
                         time_remaining=queue_item.timeleft,
                         message=message,
                         content_name=queue_item.filename,
+                        commit=False,
                     )
                     continue
 
@@ -175,6 +187,7 @@ class DownloadTracker:
                         message=message,
                         content_name=history_item.name,
                         completed_at=history_item.completed,
+                        commit=False,
                     )
                 elif self.config.debug_logging:
                     logger.info(
@@ -184,6 +197,7 @@ class DownloadTracker:
                         job.title,
                         job.status,
                     )
+            session.commit()
             self._auto_fail_jobs(session, app_config)
 
     @staticmethod
@@ -221,6 +235,7 @@ class DownloadTracker:
         threshold = timedelta(minutes=threshold_minutes)
         now = datetime.utcnow()
         terminal_statuses = {"completed", "failed", "moved"}
+        failed_any = False
         for job in list_active_download_jobs(session):
             status_value = (job.status or "").lower()
             if status_value in terminal_statuses:
@@ -234,7 +249,11 @@ class DownloadTracker:
                 session,
                 job,
                 message=f"Auto-failed after {threshold_minutes:g}m without SABnzbd progress.",
+                commit=False,
             )
+            failed_any = True
+        if failed_any:
+            session.commit()
 
     def _log_debug_snapshot(self, queue_items, history_items) -> None:
         if queue_items:
@@ -11,7 +11,7 @@ import datetime
 import re
 import unicodedata
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 
 # ---------------------------------------------------------------------------
@@ -45,14 +45,36 @@ _SEASONS = {
 ISSUE_NOUNS = ["issue", "iss", "no", "nr", "number", "#"]
 VOLUME_NOUNS = ["vol", "volume", "vol."]
 
+# Parse styles that satisfy each requested datetype component.
+_STYLES_MONTH = frozenset({1, 2, 3, 4, 5, 6, 7, 12})
+_STYLES_DAY = frozenset({3, 5, 6})
+_STYLES_MULTI_MONTH = frozenset({1})
+_STYLES_VOLUME = frozenset({2, 8, 9, 10, 11, 12, 13, 14, 17, 18})
+_STYLES_ISSUE = frozenset({2, 10, 11, 12, 13, 14, 16, 17, 18})
+_STYLES_YEAR = frozenset({1, 2, 3, 4, 5, 6, 7, 8, 10, 12, 13, 15, 16, 18})
+
 
 # ---------------------------------------------------------------------------
 # Utility helpers (ported from LazyLibrarian)
 # ---------------------------------------------------------------------------
 
 
+# Nonspacing marks from the Unicode "combining mark" blocks used by Latin scripts.
+_COMBINING_MARK_RANGES = ((0x0300, 0x0370), (0x1AB0, 0x1B00), (0x1DC0, 0x1E00), (0x20D0, 0x2100), (0xFE20, 0xFE30))
+_STRIP_MARKS_TABLE = dict.fromkeys(
+    codepoint
+    for start, stop in _COMBINING_MARK_RANGES
+    for codepoint in range(start, stop)
+    if unicodedata.category(chr(codepoint)) == 'Mn'
+)
+
+
 def unaccented(text: str) -> str:
-    return ''.join(ch for ch in unicodedata.normalize('NFD', text or '') if unicodedata.category(ch) != 'Mn')
+    decomposed = unicodedata.normalize('NFD', text or '').translate(_STRIP_MARKS_TABLE)
+    if decomposed.isascii():
+        return decomposed
+    # Marks from other scripts fall outside the translation table.
+    return ''.join(ch for ch in decomposed if unicodedata.category(ch) != 'Mn')
 
 
 def _build_clean_table(table: List[List[str]]) -> List[List[str]]:
@@ -68,6 +90,17 @@ def _build_clean_table(table: List[List[str]]) -> List[List[str]]:
 MONTH_TABLE = [_BASE_MONTH_TABLE, _build_clean_table(_BASE_MONTH_TABLE)]
 
 
+def _build_language_columns(locales: List[str]) -> Dict[str, int]:
+    columns: Dict[str, int] = {}
+    for idx, locale in enumerate(locales):
+        columns.setdefault(locale.split('_')[0].lower(), idx)
+    return columns
+
+
+# First month-table column for each language code (eg. 'de' -> 4).
+_LANG_TO_COLUMN = _build_language_columns(MONTH_TABLE[0][0])
+
+
 def replace_all(text: str, replacements: Dict[str, str]) -> str:
     for src, dst in replacements.items():
         text = text.replace(src, dst)
@@ -167,6 +200,9 @@ class IssueMetadata:
 
 def parse_issue(title: str, magazine_title: Optional[str] = None, language: str = "en") -> Optional[IssueMetadata]:
     stripped = _strip_magazine_title(title, magazine_title)
+    # Every issue code needs a year, issue or volume number; skip the full parser otherwise.
+    if not any(ch.isdigit() for ch in stripped):
+        return None
     dateparts = get_dateparts(stripped, datetype='', language=language)
     if not dateparts:
         return None
@@ -185,6 +221,11 @@ def parse_issue(title: str, magazine_title: Optional[str] = None, language: str
     )
 
 
+def parse_issues(titles: List[str], magazine_title: Optional[str] = None, language: str = "en") -> List[Optional[IssueMetadata]]:
+    # Batch entry point for the search parse pool; workers import only this module.
+    return [parse_issue(title, magazine_title, language=language) for title in titles]
+
+
 def _strip_magazine_title(title: str, magazine_title: Optional[str]) -> str:
     if not magazine_title:
         return title
@@ -217,6 +258,9 @@ def get_dateparts(title_or_issue: str, datetype: str = '', language: str = 'en')
     issuenouns = get_list(ISSUE_NOUNS)
     volumenouns = get_list(VOLUME_NOUNS)
     nouns = issuenouns + volumenouns
+    # Year/month lookups per token, shared by every scan below.
+    year_at = [check_year(word) for word in words]
+    month_at = [month2num(word) for word in words]
 
     year = 0
     months: List[int] = []
@@ -232,8 +276,8 @@ def get_dateparts(title_or_issue: str, datetype: str = '', language: str = 'en')
     pos = 0
     while pos < len(words):
         if not year:
-            year = check_year(words[pos])
-        month_val = month2num(words[pos])
+            year = year_at[pos]
+        month_val = month_at[pos]
         if month_val:
             mname = words[pos]
             months.append(month_val)
@@ -268,7 +312,7 @@ def get_dateparts(title_or_issue: str, datetype: str = '', language: str = 'en')
     while pos < len(words):
         data = words[pos]
         if data.isdigit():
-            if len(data) == 4 and check_year(data):
+            if len(data) == 4 and year_at[pos]:
                 year = int(data)
             elif len(data) == 6:
                 if check_year(data[:4]):
@@ -313,9 +357,9 @@ def get_dateparts(title_or_issue: str, datetype: str = '', language: str = 'en')
     if not dateparts['style']:
         pos = 0
         while pos < len(words):
-            year = check_year(words[pos])
+            year = year_at[pos]
             if year and pos:
-                month = month2num(words[pos - 1])
+                month = month_at[pos - 1]
                 if month:
                     if pos > 1:
                         day = check_int(re.sub(r"\D", "", words[pos - 2]), 0)
@@ -359,9 +403,9 @@ def get_dateparts(title_or_issue: str, datetype: str = '', language: str = 'en')
         if not dateparts['style']:
             pos = 0
             while pos < len(words):
-                year = check_year(words[pos])
+                year = year_at[pos]
                 if year and (pos > 1):
-                    month = month2num(words[pos - 2])
+                    month = month_at[pos - 2]
                     if month:
                         day = check_int(re.sub(r"\D", "", words[pos - 1]), 0)
                         try:
@@ -380,9 +424,9 @@ def get_dateparts(title_or_issue: str, datetype: str = '', language: str = 'en')
         if not dateparts['style']:
             pos = 0
             while pos < len(words):
-                year = check_year(words[pos])
+                year = year_at[pos]
                 if year and pos + 1 < len(words):
-                    month = month2num(words[pos + 1])
+                    month = month_at[pos + 1]
                     if not month:
                         month = check_int(words[pos + 1], 0)
                         if month > 12:
@@ -444,7 +488,7 @@ def get_dateparts(title_or_issue: str, datetype: str = '', language: str = 'en')
         if not dateparts['style'] and dateparts['year']:
             pos = 1
             while pos < len(words):
-                if check_year(words[pos]):
+                if year_at[pos]:
                     if words[pos - 1].isdigit():
                         if pos > 1 and words[pos - 2].isdigit():
                             m = int(words[pos - 1])
@@ -489,20 +533,19 @@ def get_dateparts(title_or_issue: str, datetype: str = '', language: str = 'en')
 
     datetype_ok = True
     if datetype and dateparts['style']:
-        if 'M' in datetype and (dateparts['style'] not in [1, 2, 3, 4, 5, 6, 7, 12] or not dateparts['month']):
+        style = dateparts['style']
+        wanted = set(datetype)
+        if 'M' in wanted and (style not in _STYLES_MONTH or not dateparts['month']):
             datetype_ok = False
-        if 'D' in datetype and (dateparts['style'] not in [3, 5, 6] or not dateparts['day']):
+        if 'D' in wanted and (style not in _STYLES_DAY or not dateparts['day']):
             datetype_ok = False
-        if 'MM' in datetype and (dateparts['style'] not in [1] or len(dateparts['months']) < 2):
+        if 'MM' in datetype and (style not in _STYLES_MULTI_MONTH or len(dateparts['months']) < 2):
             datetype_ok = False
-        if 'V' in datetype and (dateparts['style'] not in [2, 8, 9, 10, 11, 12, 13, 14, 17, 18]
-                                or not dateparts['volume']):
+        if 'V' in wanted and (style not in _STYLES_VOLUME or not dateparts['volume']):
             datetype_ok = False
-        if 'I' in datetype and (dateparts['style'] not in [2, 10, 11, 12, 13, 14, 16, 17, 18]
-                                or not dateparts['issue']):
+        if 'I' in wanted and (style not in _STYLES_ISSUE or not dateparts['issue']):
             datetype_ok = False
-        if 'Y' in datetype and (dateparts['style'] not in [1, 2, 3, 4, 5, 6, 7, 8, 10, 12, 13, 15, 16, 18]
-                                or not dateparts['year']):
+        if 'Y' in wanted and (style not in _STYLES_YEAR or not dateparts['year']):
             datetype_ok = False
     if not datetype_ok:
         dateparts['style'] = 0
@@ -514,23 +557,26 @@ def get_dateparts(title_or_issue: str, datetype: str = '', language: str = 'en')
         else:
             if not dateparts['day']:
                 dateparts['day'] = 1
-            if dateparts['style'] == 14:
-                issuenum = f"{dateparts['issue']:04d}"
-            elif dateparts['style'] == 15:
-                issuenum = f"{dateparts['year']}"
-            elif dateparts['style'] == 16:
-                issuenum = f"{dateparts['year']}{dateparts['issue']:04d}"
-            elif dateparts['style'] == 17:
-                issuenum = f"{dateparts['volume']:04d}{dateparts['issue']:04d}"
-            elif dateparts['style'] == 18:
-                issuenum = f"{dateparts['year']}{dateparts['volume']:04d}{dateparts['issue']:04d}"
-            else:
-                issuenum = f"{dateparts['year']}-{dateparts['month']:02d}-{dateparts['day']:02d}"
+            formatter = _DBDATE_FORMATTERS.get(dateparts['style'], _format_dbdate_ymd)
+            issuenum = formatter(dateparts)
         dateparts['dbdate'] = issuenum
 
     return dateparts if dateparts['style'] else None
 
 
+def _format_dbdate_ymd(dateparts: Dict[str, Optional[int]]) -> str:
+    return f"{dateparts['year']}-{dateparts['month']:02d}-{dateparts['day']:02d}"
+
+
+_DBDATE_FORMATTERS: Dict[int, Callable[[Dict[str, Optional[int]]], str]] = {
+    14: lambda d: f"{d['issue']:04d}",
+    15: lambda d: f"{d['year']}",
+    16: lambda d: f"{d['year']}{d['issue']:04d}",
+    17: lambda d: f"{d['volume']:04d}{d['issue']:04d}",
+    18: lambda d: f"{d['year']}{d['volume']:04d}{d['issue']:04d}",
+}
+
+
 def _format_label(dateparts: Dict[str, Optional[int]], language: str) -> str:
     year = dateparts.get('year')
     month = dateparts.get('month')
@@ -557,12 +603,7 @@ def _format_label(dateparts: Dict[str, Optional[int]], language: str) -> str:
 def _month_name(month: int, language: str) -> str:
     if not (0 < month < len(MONTH_TABLE[0])):
         return f"Month {month}"
-    lang_code = language.split('_')[0].lower()
-    locales = MONTH_TABLE[0][0]
-    indices = [idx for idx, locale in enumerate(locales) if locale.lower().startswith(lang_code)]
-    if not indices:
-        indices = [0]
-    idx = indices[0]
+    idx = _LANG_TO_COLUMN.get(language.split('_')[0].lower(), 0)
     row = MONTH_TABLE[0][month]
     if idx < len(row):
         return row[idx]
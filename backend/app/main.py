@@ -1,22 +1,27 @@
+import asyncio
 import binascii
 import logging
 import secrets
-from base64 import b64decode
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 import httpx
+import orjson
+from pybase64 import b64decode, b64encode
 from fastapi import Depends, FastAPI, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from pydantic import TypeAdapter
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 from sqlmodel import Session
 
-from .database import engine, get_session, init_db
+from .database import get_session, init_db, open_session
 from .models import AppConfig, DownloadJob, Magazine, Provider, SabnzbdConfig
 from .schemas import (
     AppConfigRead,
@@ -24,7 +29,6 @@ from .schemas import (
     AutoDownloadScanResponse,
     DownloadClearResponse,
     DownloadJobRead,
-    DownloadQueueEntry,
     DownloadQueueResponse,
     HealthResponse,
     MagazineCategoryUpdate,
@@ -50,6 +54,7 @@ from .settings import get_settings
 from .sabnzbd import (
     SabnzbdError,
     SabnzbdNotConfigured,
+    close_http_client as close_sabnzbd_client,
     enqueue_url,
     test_connection,
     is_configured as sabnzbd_configured,
@@ -59,6 +64,7 @@ from .download_monitor import DownloadMonitor, MonitorConfig, describe_downloads
 from .download_tracker import DownloadTracker, TrackerConfig
 from .services import (
     clear_download_jobs,
+    close_search_client,
     create_magazine,
     create_provider,
     create_provider_category,
@@ -79,14 +85,53 @@ from .services import (
     list_recent_download_jobs,
     search_magazines,
     set_magazine_categories,
+    shutdown_parse_pool,
     update_app_config,
     update_magazine,
     update_provider,
     update_sabnzbd_config,
-    upsert_download_job,
+    upsert_download_jobs,
+    warm_query_cache,
 )
 
-app = FastAPI(title="Gazarr API")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    loop = asyncio.get_running_loop()
+    logger.info("Event loop: %s.%s", type(loop).__module__, type(loop).__name__)
+    init_db()
+    with open_session() as session:
+        warm_query_cache(session)
+    monitor = _setup_download_monitor()
+    app.state.download_monitor = monitor
+    if monitor:
+        logger.info("Download monitor enabled.")
+    else:
+        logger.info("Download monitor disabled (missing downloads or library directory).")
+    tracker = _setup_download_tracker()
+    app.state.download_tracker = tracker
+    downloader, app_config = _setup_auto_downloader()
+    app.state.auto_downloader = downloader
+    app.state.app_config = app_config
+    if downloader:
+        logger.info("Auto downloader enabled.")
+    else:
+        logger.info("Auto downloader disabled in settings.")
+
+    yield
+
+    if monitor:
+        await monitor.stop()
+    await tracker.stop()
+    # The downloader can be started or stopped at runtime via /app/config.
+    downloader = getattr(app.state, "auto_downloader", None)
+    if downloader:
+        await downloader.stop()
+    await close_sabnzbd_client()
+    await close_search_client()
+    shutdown_parse_pool()
+
+
+app = FastAPI(title="Gazarr API", default_response_class=ORJSONResponse, lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -96,45 +141,94 @@ app.add_middleware(
 )
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
-class BasicAuthMiddleware(BaseHTTPMiddleware):
-    """Global HTTP Basic authentication enforced for every request, including static files."""
+_ACCEPTED_HEADER_CACHE_SIZE = 64
 
-    def __init__(self, app, *, username: str, password: str, realm: str = "Gazarr") -> None:
-        super().__init__(app)
-        self._username = username
-        self._password = password
-        self._realm = realm
 
-    async def dispatch(self, request: Request, call_next):
-        if request.method == "OPTIONS":
-            return await call_next(request)
+class BasicAuthMiddleware:
+    """Global HTTP Basic authentication enforced for every request, including static files."""
 
-        header = request.headers.get("Authorization")
-        if not header or not header.startswith("Basic "):
-            return self._challenge()
-        token = header.split(" ", 1)[1]
+    def __init__(self, app: ASGIApp, *, username: str, password: str, realm: str = "Gazarr") -> None:
+        self.app = app
+        self._username = username.encode("utf-8")
+        self._password = password.encode("utf-8")
+        self._expected_header = b"Basic " + b64encode(self._username + b":" + self._password)
+        # Header variants that passed the slow path; only ever holds valid credentials.
+        self._accepted_headers: Dict[bytes, None] = {}
+        self._challenge_headers = [
+            (b"www-authenticate", f'Basic realm="{realm}"'.encode("latin-1")),
+            (b"content-length", b"0"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+        if scope["path"] == "/health" and scope["method"] in ("GET", "HEAD"):
+            # Liveness probes are answered here without credentials, routing or validation.
+            await _send_health(scope, send)
+            return
+        if not self._is_authorized(_find_header(scope, b"authorization")):
+            await self._challenge(send)
+            return
+        await self.app(scope, receive, send)
+
+    def _is_authorized(self, header: Optional[bytes]) -> bool:
+        if not header:
+            return False
+        if secrets.compare_digest(header, self._expected_header) or header in self._accepted_headers:
+            return True
+        # Slow path tolerates clients that pad the token with extra whitespace.
+        if not header.startswith(b"Basic "):
+            return False
         try:
-            decoded = b64decode(token, validate=True).decode("utf-8")
-        except (binascii.Error, ValueError, UnicodeDecodeError):
-            return self._challenge()
-        username, sep, password = decoded.partition(":")
+            decoded = b64decode(header[6:].strip(), validate=True)
+        except (binascii.Error, ValueError):
+            return False
+        username, sep, password = decoded.partition(b":")
         if not sep:
-            return self._challenge()
+            return False
         if not (secrets.compare_digest(username, self._username) and secrets.compare_digest(password, self._password)):
-            return self._challenge()
-        return await call_next(request)
-
-    def _challenge(self) -> Response:
-        return Response(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            headers={"WWW-Authenticate": f'Basic realm="{self._realm}"'},
+            return False
+        if len(self._accepted_headers) >= _ACCEPTED_HEADER_CACHE_SIZE:
+            self._accepted_headers.pop(next(iter(self._accepted_headers)))
+        self._accepted_headers[header] = None
+        return True
+
+    async def _challenge(self, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_401_UNAUTHORIZED,
+                "headers": self._challenge_headers,
+            }
         )
+        await send({"type": "http.response.body", "body": b""})
+
+
+_HEALTH_BODY = b'{"status":"ok"}'
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode("latin-1")),
+]
+
+
+async def _send_health(scope: Scope, send: Send) -> None:
+    await send({"type": "http.response.start", "status": status.HTTP_200_OK, "headers": _HEALTH_HEADERS})
+    body = b"" if scope["method"] == "HEAD" else _HEALTH_BODY
+    await send({"type": "http.response.body", "body": body})
+
+
+def _find_header(scope: Scope, name: bytes) -> Optional[bytes]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
 
 
 def _configure_basic_auth(app: FastAPI) -> None:
-    settings = get_settings()
     username = settings.auth_username
     password = settings.auth_password
     if not username or not password:
@@ -148,28 +242,33 @@ def _configure_basic_auth(app: FastAPI) -> None:
 _configure_basic_auth(app)
 
 
-def _setup_download_monitor() -> Optional[DownloadMonitor]:
-    settings = get_settings()
+@lru_cache(maxsize=1)
+def _cached_monitor_config() -> Optional[MonitorConfig]:
     downloads_dir = settings.downloads_dir
     library_dir = settings.library_dir
     if not downloads_dir or not library_dir:
         return None
-
-    config = MonitorConfig(
-        source_dir=downloads_dir.expanduser(),
-        target_dir=library_dir.expanduser(),
-        staging_dir=settings.staging_dir.expanduser() if settings.staging_dir else None,
+    return MonitorConfig(
+        source_dir=downloads_dir,
+        target_dir=library_dir,
+        staging_dir=settings.staging_dir,
         poll_interval=settings.downloads_poll_interval,
         settle_seconds=settings.downloads_settle_seconds,
-        cover_dir=settings.covers_dir.expanduser() if settings.covers_dir else None,
+        cover_dir=settings.covers_dir,
     )
+
+
+def _setup_download_monitor() -> Optional[DownloadMonitor]:
+    config = _cached_monitor_config()
+    if not config:
+        return None
     monitor = DownloadMonitor(config)
     monitor.start()
     return monitor
 
 
 def _setup_download_tracker() -> DownloadTracker:
-    with Session(engine) as session:
+    with open_session() as session:
         app_config = get_app_config(session)
     tracker_config = _tracker_config_from_settings(app_config.debug_logging)
     tracker = DownloadTracker(tracker_config)
@@ -178,7 +277,6 @@ def _setup_download_tracker() -> DownloadTracker:
 
 
 def _tracker_config_from_settings(debug_logging: bool) -> TrackerConfig:
-    settings = get_settings()
     return TrackerConfig(
         poll_interval=settings.download_tracker_poll_interval,
         history_limit=settings.download_tracker_history_limit,
@@ -187,7 +285,7 @@ def _tracker_config_from_settings(debug_logging: bool) -> TrackerConfig:
 
 
 def _setup_auto_downloader() -> Tuple[Optional[AutoDownloader], AppConfig]:
-    with Session(engine) as session:
+    with open_session() as session:
         app_config = get_app_config(session)
     downloader: Optional[AutoDownloader] = None
     if app_config.auto_download_enabled:
@@ -197,9 +295,9 @@ def _setup_auto_downloader() -> Tuple[Optional[AutoDownloader], AppConfig]:
 
 
 def _auto_download_config_from_model(config: AppConfig) -> AutoDownloadConfig:
-    interval_hours = config.auto_download_interval or get_settings().auto_download_interval
+    interval_hours = config.auto_download_interval or settings.auto_download_interval
     interval = max(60.0, interval_hours * 3600.0)
-    max_results = config.auto_download_max_results or get_settings().auto_download_max_results
+    max_results = config.auto_download_max_results or settings.auto_download_max_results
     return AutoDownloadConfig(
         poll_interval=interval,
         max_results_per_scan=max_results,
@@ -229,37 +327,24 @@ def _sync_download_tracker_state(app: FastAPI, config: AppConfig) -> None:
     tracker.update_config(_tracker_config_from_settings(config.debug_logging))
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    init_db()
-    monitor = _setup_download_monitor()
-    if monitor:
-        app.state.download_monitor = monitor
-        logger.info("Download monitor enabled.")
-    else:
-        logger.info("Download monitor disabled (missing downloads or library directory).")
-    tracker = _setup_download_tracker()
-    app.state.download_tracker = tracker
-    downloader, app_config = _setup_auto_downloader()
-    app.state.auto_downloader = downloader
-    app.state.app_config = app_config
-    if downloader:
-        logger.info("Auto downloader enabled.")
-    else:
-        logger.info("Auto downloader disabled in settings.")
+# Hot list endpoints validate and serialize ORM rows in a single pydantic-core pass
+# instead of FastAPI re-validating each returned model.
+_PROVIDER_LIST_ADAPTER = TypeAdapter(List[ProviderRead])
+_MAGAZINE_LIST_ADAPTER = TypeAdapter(List[MagazineRead])
+_DOWNLOAD_JOB_LIST_ADAPTER = TypeAdapter(List[DownloadJobRead])
+_SEARCH_RESULT_LIST_ADAPTER = TypeAdapter(List[SearchResult])
 
 
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    monitor: Optional[DownloadMonitor] = getattr(app.state, "download_monitor", None)
-    if monitor:
-        await monitor.stop()
-    tracker: Optional[DownloadTracker] = getattr(app.state, "download_tracker", None)
-    if tracker:
-        await tracker.stop()
-    downloader: Optional[AutoDownloader] = getattr(app.state, "auto_downloader", None)
-    if downloader:
-        await downloader.stop()
+class _UTCZResponse(ORJSONResponse):
+    """ORJSONResponse that writes aware UTC datetimes with a trailing Z, as pydantic does."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z)
+
+
+def _json_list_response(adapter: TypeAdapter, rows: List) -> Response:
+    payload = adapter.validate_python(rows, from_attributes=True)
+    return Response(content=adapter.dump_json(payload), media_type="application/json")
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -271,8 +356,8 @@ def health() -> HealthResponse:
 
 
 @app.get("/providers", response_model=List[ProviderRead])
-def read_providers(session: Session = Depends(get_session)) -> List[Provider]:
-    return list_providers(session)
+def read_providers(session: Session = Depends(get_session)) -> Response:
+    return _json_list_response(_PROVIDER_LIST_ADAPTER, list_providers(session))
 
 
 @app.post("/providers", response_model=ProviderRead, status_code=status.HTTP_201_CREATED)
@@ -333,8 +418,8 @@ def delete_provider_category_endpoint(provider_id: int, category_id: int, sessio
 
 
 @app.get("/magazines", response_model=List[MagazineRead])
-def read_magazines(status_filter: Optional[str] = None, session: Session = Depends(get_session)) -> List[Magazine]:
-    return list_magazines(session, status=status_filter)
+def read_magazines(status_filter: Optional[str] = None, session: Session = Depends(get_session)) -> Response:
+    return _json_list_response(_MAGAZINE_LIST_ADAPTER, list_magazines(session, status=status_filter))
 
 
 @app.post("/magazines", response_model=MagazineRead, status_code=status.HTTP_201_CREATED)
@@ -385,8 +470,10 @@ def update_magazine_categories_endpoint(
 
 
 @app.post("/magazines/search", response_model=List[SearchResult])
-async def search_magazines_endpoint(payload: SearchRequest, session: Session = Depends(get_session)) -> List[SearchResult]:
-    return await search_magazines(session, titles=payload.titles)
+async def search_magazines_endpoint(payload: SearchRequest, session: Session = Depends(get_session)) -> Response:
+    results = await search_magazines(session, titles=payload.titles)
+    # Results are already validated SearchResult models; serialize them directly.
+    return Response(content=_SEARCH_RESULT_LIST_ADAPTER.dump_json(results), media_type="application/json")
 
 
 @app.get("/sabnzbd/config", response_model=SabnzbdConfigRead)
@@ -432,34 +519,28 @@ def sabnzbd_status_endpoint(session: Session = Depends(get_session)) -> SabnzbdS
 
 
 @app.get("/downloads", response_model=DownloadQueueResponse)
-def list_downloads_endpoint(session: Session = Depends(get_session)) -> DownloadQueueResponse:
-    settings = get_settings()
-    downloads_dir = settings.downloads_dir
-    library_dir = settings.library_dir
+def list_downloads_endpoint(session: Session = Depends(get_session)) -> _UTCZResponse:
     jobs = list_recent_download_jobs(session)
-    job_payload = [DownloadJobRead.model_validate(job) for job in jobs]
-    if not downloads_dir or not library_dir:
-        return DownloadQueueResponse(enabled=False, entries=[], jobs=job_payload)
-
-    config = MonitorConfig(
-        source_dir=downloads_dir.expanduser(),
-        target_dir=library_dir.expanduser(),
-        staging_dir=settings.staging_dir.expanduser() if settings.staging_dir else None,
-        poll_interval=settings.downloads_poll_interval,
-        settle_seconds=settings.downloads_settle_seconds,
+    job_payload = _DOWNLOAD_JOB_LIST_ADAPTER.dump_python(
+        _DOWNLOAD_JOB_LIST_ADAPTER.validate_python(jobs, from_attributes=True)
     )
-    entries = []
+    config = _cached_monitor_config()
+    if not config:
+        return _UTCZResponse({"enabled": False, "entries": [], "jobs": job_payload})
+    entries = list(_iter_download_entries(config))
+    return _UTCZResponse({"enabled": True, "entries": entries, "jobs": job_payload})
+
+
+def _iter_download_entries(config: MonitorConfig) -> Iterator[Dict[str, Any]]:
+    """Yield DownloadQueueEntry-shaped dicts, which orjson serializes without a model layer."""
     for item in describe_downloads(config):
-        entries.append(
-            DownloadQueueEntry(
-                name=item.name,
-                type=item.type,
-                size=item.size,
-                modified=datetime.fromtimestamp(item.modified_ts, tz=timezone.utc),
-                ready=item.ready,
-            )
-        )
-    return DownloadQueueResponse(enabled=True, entries=entries, jobs=job_payload)
+        yield {
+            "name": item.name,
+            "type": item.type,
+            "size": item.size,
+            "modified": datetime.fromtimestamp(item.modified_ts, tz=timezone.utc),
+            "ready": item.ready,
+        }
 
 
 @app.delete("/downloads", response_model=DownloadClearResponse)
@@ -536,20 +617,19 @@ async def sabnzbd_download_endpoint(
         ) from exc
     str_link = str(payload.link)
     meta = payload.metadata.model_dump(exclude_none=True) if payload.metadata else {}
-    for nzo_id in result.nzo_ids:
-        upsert_download_job(
-            session,
-            nzo_id=nzo_id,
-            title=payload.title or None,
-            magazine_title=meta.get("magazine_title"),
-            link=str_link,
-            status="queued",
-            issue_code=meta.get("issue_code"),
-            issue_label=meta.get("issue_label"),
-            issue_year=meta.get("issue_year"),
-            issue_month=meta.get("issue_month"),
-            issue_number=meta.get("issue_number"),
-        )
+    upsert_download_jobs(
+        session,
+        result.nzo_ids,
+        title=payload.title or None,
+        magazine_title=meta.get("magazine_title"),
+        link=str_link,
+        status="queued",
+        issue_code=meta.get("issue_code"),
+        issue_label=meta.get("issue_label"),
+        issue_year=meta.get("issue_year"),
+        issue_month=meta.get("issue_month"),
+        issue_number=meta.get("issue_number"),
+    )
     return SabnzbdEnqueueResponse(nzo_ids=result.nzo_ids, message=result.message)
 
 
@@ -585,7 +665,22 @@ async def sabnzbd_test_endpoint(session: Session = Depends(get_session)) -> Sabn
 
 # Directory populated by Docker build: copied to /app/static in the image
 _STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+# SvelteKit emits content-hashed bundles here; their URLs change whenever the content does.
+_IMMUTABLE_ASSET_PREFIX = "_app/immutable/"
+
+
+class FrontendStaticFiles(StaticFiles):
+    """SPA static files with far-future caching for hashed assets and revalidation for everything else."""
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if self.get_path(scope).startswith(_IMMUTABLE_ASSET_PREFIX):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
 
 if _STATIC_DIR.exists():
     # Mount SPA at root; API routes defined above still take precedence.
-    app.mount("/", StaticFiles(directory=str(_STATIC_DIR), html=True), name="frontend")
+    app.mount("/", FrontendStaticFiles(directory=str(_STATIC_DIR), html=True), name="frontend")
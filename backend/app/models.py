@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, Float
+from sqlalchemy import Column, Float, event
 from sqlmodel import Field, SQLModel
 
 
@@ -24,7 +24,7 @@ class Magazine(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(index=True, unique=True, min_length=1)
     regex: Optional[str] = Field(default=None, description="Optional custom search term/regex.")
-    status: str = Field(default="active", description="active | paused")
+    status: str = Field(default="active", index=True, description="active | paused")
     language: str = Field(default="en", description="Language code for issue parsing (en|de).")
     interval_months: Optional[int] = Field(
         default=None,
@@ -111,7 +111,7 @@ class DownloadJob(SQLModel, table=True):
     magazine_title: Optional[str] = Field(default=None, description="Canonical magazine title provided by Gazarr.")
     link: Optional[str] = Field(default=None, description="Original NZB link used to enqueue the job.")
     content_name: Optional[str] = Field(default=None, description="Filename or folder name reported by SABnzbd.")
-    status: str = Field(default="pending", description="High level status (pending, queued, downloading, completed, failed, moved).")
+    status: str = Field(default="pending", index=True, description="High level status (pending, queued, downloading, completed, failed, moved).")
     sab_status: Optional[str] = Field(default=None, description="Raw SABnzbd status string.")
     progress: Optional[float] = Field(default=None, description="Progress percentage 0-100 when available.")
     time_remaining: Optional[str] = Field(default=None, description="Human friendly time remaining reported by SABnzbd.")
@@ -125,7 +125,33 @@ class DownloadJob(SQLModel, table=True):
     issue_month: Optional[int] = Field(default=None, description="Issue month if determinable.")
     issue_number: Optional[int] = Field(default=None, description="Issue number if determinable.")
     last_seen: Optional[datetime] = Field(default=None, description="Timestamp of last update received from SABnzbd.")
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
     updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     completed_at: Optional[datetime] = Field(default=None, description="When SABnzbd finished processing.")
     moved_at: Optional[datetime] = Field(default=None, description="When Gazarr moved the download into the library.")
+    clean_stem: Optional[str] = Field(default=None, index=True, description="Lowercased stem of clean_name for entry matching.")
+    content_stem: Optional[str] = Field(default=None, index=True, description="Lowercased stem of content_name for entry matching.")
+    title_stem: Optional[str] = Field(default=None, index=True, description="Lowercased stem of title for entry matching.")
+
+
+def match_stem(name: Optional[str]) -> Optional[str]:
+    """Lowercased PurePosixPath(name).stem computed with string ops; None for blank names."""
+    if not name:
+        return None
+    value = name.strip().lower()
+    head, _, base = value.rstrip("/").rpartition("/")
+    while base == ".":
+        head, _, base = head.rstrip("/").rpartition("/")
+    dot = base.rfind(".")
+    if 0 < dot < len(base) - 1:
+        base = base[:dot]
+    return base or None
+
+
+@event.listens_for(DownloadJob, "before_insert")
+@event.listens_for(DownloadJob, "before_update")
+def _sync_download_job_stems(_mapper, _connection, job: DownloadJob) -> None:
+    # Every write path goes through the ORM, so the match columns can't drift from the names.
+    job.clean_stem = match_stem(job.clean_name)
+    job.content_stem = match_stem(job.content_name)
+    job.title_stem = match_stem(job.title)
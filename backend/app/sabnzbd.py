@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
+import orjson
 
 
 class SabnzbdNotConfigured(RuntimeError):
@@ -13,13 +15,17 @@ class SabnzbdError(RuntimeError):
     """Raised when SABnzbd returns an error response."""
 
 
-@dataclass
+@dataclass(frozen=True)
 class SabnzbdConnection:
     base_url: str
     api_key: str
     category: Optional[str] = None
     priority: Optional[int] = None
     timeout: int = 10
+    api_url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "api_url", _build_api_url(self.base_url))
 
 
 @dataclass
@@ -39,7 +45,7 @@ class SabnzbdTestResult:
     response: Dict[str, Any]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SabnzbdQueueItem:
     nzo_id: Optional[str]
     filename: Optional[str]
@@ -48,7 +54,7 @@ class SabnzbdQueueItem:
     timeleft: Optional[str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SabnzbdHistoryItem:
     nzo_id: Optional[str]
     name: Optional[str]
@@ -68,6 +74,48 @@ def _build_api_url(base_url: str) -> str:
     return f"{base_url}/api"
 
 
+_OK_STATUSES = frozenset({"true", "1", "ok", "success"})
+_ADDURL_PARAMS: Dict[str, Any] = {"mode": "addurl", "output": "json"}
+# Static queries as (key, value) pairs; httpx builds QueryParams from these faster than from dicts.
+_AUTH_PARAMS = (("mode", "auth"), ("output", "json"))
+_QUEUE_PARAMS = (("mode", "queue"), ("output", "json"))
+_HISTORY_PARAMS = (("mode", "history"), ("output", "json"))
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client used for every SABnzbd call."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def _api_request(
+    conn: SabnzbdConnection,
+    method: str,
+    params: Union[Dict[str, Any], List[Tuple[str, str]]],
+) -> Dict[str, Any]:
+    response = await get_http_client().request(method, conn.api_url, params=params, timeout=conn.timeout)
+    response.raise_for_status()
+
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as exc:
+        raise SabnzbdError("Invalid JSON response from SABnzbd.") from exc
+
+
 async def enqueue_url(
     nzb_url: str,
     title: Optional[str] = None,
@@ -78,13 +126,7 @@ async def enqueue_url(
 
     assert connection is not None
     conn = connection
-    api_url = _build_api_url(conn.base_url)
-    params: Dict[str, Any] = {
-        "mode": "addurl",
-        "name": nzb_url,
-        "apikey": conn.api_key,
-        "output": "json",
-    }
+    params: Dict[str, Any] = {**_ADDURL_PARAMS, "name": nzb_url, "apikey": conn.api_key}
     if title:
         params["nzbname"] = title
     if conn.category:
@@ -92,18 +134,11 @@ async def enqueue_url(
     if conn.priority is not None:
         params["priority"] = str(conn.priority)
 
-    async with httpx.AsyncClient(timeout=conn.timeout) as client:
-        response = await client.post(api_url, params=params)
-    response.raise_for_status()
-
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise SabnzbdError("Invalid JSON response from SABnzbd.") from exc
+    payload = await _api_request(conn, "POST", params)
 
     status_value = payload.get("status")
     if isinstance(status_value, str):
-        status_ok = status_value.lower() in {"true", "1", "ok", "success"}
+        status_ok = status_value.casefold() in _OK_STATUSES
     else:
         status_ok = bool(status_value)
 
@@ -120,33 +155,23 @@ async def enqueue_url(
     return SabnzbdQueueResult(nzo_ids=nzo_ids, response=payload)
 
 
-async def test_connection(connection: Optional[SabnzbdConnection] = None) -> SabnzbdTestResult:
+async def test_connection(
+    connection: Optional[SabnzbdConnection] = None,
+) -> SabnzbdTestResult:
     if not is_configured(connection):
         raise SabnzbdNotConfigured("SABnzbd connection is not configured.")
 
     assert connection is not None
     conn = connection
-    api_url = _build_api_url(conn.base_url)
-    params: Dict[str, Any] = {
-        "mode": "auth",
-        "apikey": conn.api_key,
-        "output": "json",
-    }
-
-    async with httpx.AsyncClient(timeout=conn.timeout) as client:
-        response = await client.get(api_url, params=params)
-    response.raise_for_status()
+    params = [*_AUTH_PARAMS, ("apikey", conn.api_key)]
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise SabnzbdError("Invalid JSON response from SABnzbd.") from exc
+    payload = await _api_request(conn, "GET", params)
 
     status_value = payload.get("status")
     if status_value is None and payload.get("auth") is not None:
         status_ok = True
     elif isinstance(status_value, str):
-        status_ok = status_value.lower() in {"true", "1", "ok", "success"}
+        status_ok = status_value.casefold() in _OK_STATUSES
     else:
         status_ok = bool(status_value)
 
@@ -165,41 +190,41 @@ def _safe_float(value: Any) -> Optional[float]:
         return None
 
 
-async def fetch_queue(connection: Optional[SabnzbdConnection] = None) -> List[SabnzbdQueueItem]:
+def _parse_completed(value: Any) -> Optional[datetime]:
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    if isinstance(value, str):
+        try:
+            return datetime.fromtimestamp(int(value), tz=timezone.utc)
+        except ValueError:
+            return None
+    return None
+
+
+async def fetch_queue(
+    connection: Optional[SabnzbdConnection] = None,
+) -> List[SabnzbdQueueItem]:
     if not is_configured(connection):
         raise SabnzbdNotConfigured("SABnzbd connection is not configured.")
 
     assert connection is not None
     conn = connection
-    api_url = _build_api_url(conn.base_url)
-    params: Dict[str, Any] = {
-        "mode": "queue",
-        "apikey": conn.api_key,
-        "output": "json",
-    }
-
-    async with httpx.AsyncClient(timeout=conn.timeout) as client:
-        response = await client.get(api_url, params=params)
-    response.raise_for_status()
+    params = [*_QUEUE_PARAMS, ("apikey", conn.api_key)]
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise SabnzbdError("Invalid JSON response from SABnzbd.") from exc
+    payload = await _api_request(conn, "GET", params)
 
     queue_data = payload.get("queue") or {}
     slots = queue_data.get("slots") or []
-    items: List[SabnzbdQueueItem] = []
-    for slot in slots:
-        items.append(
-            SabnzbdQueueItem(
-                nzo_id=slot.get("nzo_id"),
-                filename=slot.get("filename") or slot.get("title"),
-                status=slot.get("status"),
-                percentage=_safe_float(slot.get("percentage")),
-                timeleft=slot.get("timeleft"),
-            )
+    items = [
+        SabnzbdQueueItem(
+            nzo_id=slot.get("nzo_id"),
+            filename=slot.get("filename") or slot.get("title"),
+            status=slot.get("status"),
+            percentage=_safe_float(slot.get("percentage")),
+            timeleft=slot.get("timeleft"),
         )
+        for slot in slots
+    ]
     return items
 
 
@@ -212,43 +237,31 @@ async def fetch_history(
 
     assert connection is not None
     conn = connection
-    api_url = _build_api_url(conn.base_url)
-    params: Dict[str, Any] = {
-        "mode": "history",
-        "apikey": conn.api_key,
-        "output": "json",
-        "limit": str(limit),
-    }
-
-    async with httpx.AsyncClient(timeout=conn.timeout) as client:
-        response = await client.get(api_url, params=params)
-    response.raise_for_status()
+    params = [*_HISTORY_PARAMS, ("apikey", conn.api_key), ("limit", str(limit))]
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise SabnzbdError("Invalid JSON response from SABnzbd.") from exc
+    payload = await _api_request(conn, "GET", params)
 
     history_data = payload.get("history") or {}
     slots = history_data.get("slots") or []
-    items: List[SabnzbdHistoryItem] = []
-    for slot in slots:
-        completed_ts = slot.get("completed")
-        completed_dt: Optional[datetime] = None
-        if isinstance(completed_ts, (int, float)):
-            completed_dt = datetime.fromtimestamp(completed_ts, tz=timezone.utc)
-        elif isinstance(completed_ts, str):
-            try:
-                completed_dt = datetime.fromtimestamp(int(completed_ts), tz=timezone.utc)
-            except (TypeError, ValueError):
-                completed_dt = None
-        items.append(
-            SabnzbdHistoryItem(
-                nzo_id=slot.get("nzo_id"),
-                name=slot.get("name") or slot.get("title"),
-                status=slot.get("status"),
-                completed=completed_dt,
-                fail_message=slot.get("fail_message"),
-            )
+    items = [
+        SabnzbdHistoryItem(
+            nzo_id=slot.get("nzo_id"),
+            name=slot.get("name") or slot.get("title"),
+            status=slot.get("status"),
+            completed=_parse_completed(slot.get("completed")),
+            fail_message=slot.get("fail_message"),
         )
+        for slot in slots
+    ]
     return items
+
+
+async def fetch_queue_and_history(
+    connection: Optional[SabnzbdConnection] = None,
+    limit: int = 50,
+) -> Tuple[List[SabnzbdQueueItem], List[SabnzbdHistoryItem]]:
+    queue_items, history_items = await asyncio.gather(
+        fetch_queue(connection),
+        fetch_history(connection, limit=limit),
+    )
+    return queue_items, history_items
@@ -1,15 +1,17 @@
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, constr
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+
+from .types import HttpUrlStr, LanguageCode, NonEmptyStr
 
 
 class ProviderBase(BaseModel):
-    name: constr(strip_whitespace=True, min_length=1)
-    base_url: HttpUrl = Field(description="Full Torznab/Newznab endpoint such as https://prow.example/api")
-    api_key: constr(strip_whitespace=True, min_length=1)
+    name: NonEmptyStr
+    base_url: HttpUrlStr = Field(description="Full Torznab/Newznab endpoint such as https://prow.example/api")
+    api_key: NonEmptyStr
     enabled: bool = True
-    download_types: constr(strip_whitespace=True, min_length=1) = "M"
+    download_types: NonEmptyStr = "M"
 
 
 class ProviderCreate(ProviderBase):
@@ -17,11 +19,11 @@ class ProviderCreate(ProviderBase):
 
 
 class ProviderUpdate(BaseModel):
-    name: Optional[constr(strip_whitespace=True, min_length=1)] = None
-    base_url: Optional[HttpUrl] = None
-    api_key: Optional[constr(strip_whitespace=True, min_length=1)] = None
+    name: Optional[NonEmptyStr] = None
+    base_url: Optional[HttpUrlStr] = None
+    api_key: Optional[NonEmptyStr] = None
     enabled: Optional[bool] = None
-    download_types: Optional[constr(strip_whitespace=True, min_length=1)] = None
+    download_types: Optional[NonEmptyStr] = None
 
 
 class ProviderRead(ProviderBase):
@@ -29,13 +31,12 @@ class ProviderRead(ProviderBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ProviderCategoryBase(BaseModel):
-    code: constr(strip_whitespace=True, min_length=1)
-    name: constr(strip_whitespace=True, min_length=1)
+    code: NonEmptyStr
+    name: NonEmptyStr
 
 
 class ProviderCategoryCreate(ProviderCategoryBase):
@@ -48,15 +49,14 @@ class ProviderCategoryRead(ProviderCategoryBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MagazineBase(BaseModel):
-    title: constr(strip_whitespace=True, min_length=1)
-    regex: Optional[constr(strip_whitespace=True, min_length=1)] = None
-    status: constr(strip_whitespace=True, min_length=1) = "active"
-    language: constr(strip_whitespace=True, min_length=2, max_length=5) = "en"
+    title: NonEmptyStr
+    regex: Optional[NonEmptyStr] = None
+    status: NonEmptyStr = "active"
+    language: LanguageCode = "en"
     interval_months: Optional[int] = Field(
         default=None,
         ge=1,
@@ -99,10 +99,10 @@ class MagazineCreate(MagazineBase):
 
 
 class MagazineUpdate(BaseModel):
-    title: Optional[constr(strip_whitespace=True, min_length=1)] = None
-    regex: Optional[constr(strip_whitespace=True, min_length=1)] = None
-    status: Optional[constr(strip_whitespace=True, min_length=1)] = None
-    language: Optional[constr(strip_whitespace=True, min_length=2, max_length=5)] = None
+    title: Optional[NonEmptyStr] = None
+    regex: Optional[NonEmptyStr] = None
+    status: Optional[NonEmptyStr] = None
+    language: Optional[LanguageCode] = None
     interval_months: Optional[int] = Field(default=None, ge=1, le=12)
     interval_reference_issue: Optional[int] = Field(default=None, ge=1)
     interval_reference_year: Optional[int] = Field(default=None, ge=1900, le=2200)
@@ -116,8 +116,13 @@ class MagazineRead(MagazineBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("language", mode="before")
+    @classmethod
+    def _default_language(cls, value: Optional[str]) -> str:
+        # Rows created before the language column existed hold NULL.
+        return value or "en"
 
 
 class HealthResponse(BaseModel):
@@ -161,8 +166,8 @@ class SabnzbdDownloadMetadata(BaseModel):
 
 
 class SabnzbdEnqueueRequest(BaseModel):
-    link: HttpUrl = Field(description="NZB download URL to forward to SABnzbd.")
-    title: Optional[constr(strip_whitespace=True, min_length=1)] = Field(default=None, description="Optional display title in SABnzbd.")
+    link: HttpUrlStr = Field(description="NZB download URL to forward to SABnzbd.")
+    title: Optional[NonEmptyStr] = Field(default=None, description="Optional display title in SABnzbd.")
     metadata: Optional[SabnzbdDownloadMetadata] = Field(default=None, description="Optional issue metadata payload from the UI.")
 
 
@@ -179,8 +184,8 @@ class SabnzbdTestResponse(BaseModel):
 
 class SabnzbdConfigBase(BaseModel):
     base_url: Optional[HttpUrl] = None
-    api_key: Optional[constr(strip_whitespace=True, min_length=1)] = None
-    category: Optional[constr(strip_whitespace=True, min_length=1)] = None
+    api_key: Optional[NonEmptyStr] = None
+    category: Optional[NonEmptyStr] = None
     priority: Optional[int] = Field(default=None, ge=-1, le=2)
     timeout: Optional[int] = Field(default=None, ge=1, le=180)
 
@@ -194,8 +199,7 @@ class SabnzbdConfigRead(SabnzbdConfigBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 AUTO_DOWNLOAD_MIN_HOURS = 0.25
@@ -225,8 +229,7 @@ class AppConfigRead(AppConfigBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ProviderCategoryOption(BaseModel):
@@ -252,7 +255,7 @@ class DownloadQueueEntry(BaseModel):
     name: str
     type: Literal["file", "directory"]
     size: int
-    modified: datetime
+    modified: datetime = Field(description="Last modification time (UTC).")
     ready: bool
 
 
@@ -281,8 +284,7 @@ class DownloadJobRead(BaseModel):
     completed_at: Optional[datetime] = None
     moved_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DownloadQueueResponse(BaseModel):
@@ -1,9 +1,10 @@
 import argparse
 import sys
 
-from sqlmodel import Session, select
+from sqlalchemy import literal, union_all
+from sqlmodel import select
 
-from .database import engine, init_db
+from .database import init_db, open_session
 from .models import Magazine, Provider
 from .schemas import MagazineCreate, ProviderCreate
 from .services import create_magazine, create_provider
@@ -24,9 +25,16 @@ def parse_args(argv) -> argparse.Namespace:
 def main(argv=None) -> int:
     args = parse_args(argv or sys.argv[1:])
     init_db()
-    with Session(engine) as session:
-        provider_exists = session.exec(select(Provider).where(Provider.name == args.provider_name)).first()
-        if not provider_exists:
+    with open_session() as session:
+        existing = set(
+            session.exec(
+                union_all(
+                    select(literal("provider")).where(Provider.name == args.provider_name),
+                    select(literal("magazine")).where(Magazine.title == args.magazine_title),
+                )
+            ).scalars()
+        )
+        if "provider" not in existing:
             create_provider(
                 session,
                 ProviderCreate(
@@ -35,8 +43,7 @@ def main(argv=None) -> int:
                     api_key=args.provider_key,
                 ),
             )
-        magazine_exists = session.exec(select(Magazine).where(Magazine.title == args.magazine_title)).first()
-        if not magazine_exists:
+        if "magazine" not in existing:
             create_magazine(
                 session,
                 MagazineCreate(title=args.magazine_title, regex=args.magazine_regex),
@@ -1,15 +1,25 @@
 import asyncio
 import logging
+import multiprocessing
+import os
 import shutil
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, DefaultDict, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 from xml.etree import ElementTree as ET
 
 import httpx
+from sqlalchemy import func, or_
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, delete, select
+from sqlalchemy.orm import defer
+from sqlmodel import Session, delete, insert, select
 
 from .models import (
     AppConfig,
@@ -19,10 +29,10 @@ from .models import (
     Provider,
     ProviderCategory,
     SabnzbdConfig,
+    match_stem,
 )
 from .schemas import (
     AppConfigUpdate,
-    MagazineCategoryUpdate,
     MagazineCreate,
     MagazineUpdate,
     ProviderCategoryCreate,
@@ -34,17 +44,81 @@ from .schemas import (
 )
 from .settings import get_settings
 from .sabnzbd import SabnzbdConnection
-from .issue_parser import parse_issue
+from .issue_parser import IssueMetadata, parse_issues
+
+try:
+    from lxml import etree as LET
+except ImportError:  # pragma: no cover - lxml is an optional accelerator
+    LET = None
 
 logger = logging.getLogger(__name__)
 
 NEWZNAB_NS = {"newznab": "http://www.newznab.com/DTD/2010/feeds/attributes/"}
+# Clark-notation tag: ElementTree matches it in C instead of resolving a prefixed path per item.
+_NEWZNAB_ATTR_TAG = f"{{{NEWZNAB_NS['newznab']}}}attr"
+
+# Issue parsing is CPU-bound; large provider responses are parsed in worker processes
+# so the event loop keeps servicing other providers' network I/O meanwhile. A couple of
+# workers is plenty, and they import only issue_parser (not the engine or settings).
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_MIN_BATCH = 16
+_PARSE_POOL_MAX_WORKERS = 2
+
+_search_client: Optional[httpx.AsyncClient] = None
+
+# (title, link, published, size, categories) for one feed item.
+_TorznabEntry = Tuple[str, str, Optional[datetime], Optional[int], List[str]]
+_SearchKey = Tuple[str, str, str, Optional[str]]
+# Recent provider responses, so repeated searches and magazines sharing a term reuse one GET.
+_search_cache: Dict[_SearchKey, Tuple[float, List[_TorznabEntry]]] = {}
+_search_inflight: Dict[_SearchKey, "asyncio.Future[List[_TorznabEntry]]"] = {}
+# Issue metadata per (magazine title, language) and release title, shared across one search run.
+_ParseCache = Dict[Tuple[str, str], Dict[str, Optional[IssueMetadata]]]
+
+
+# Searches only need these columns, so they're selected as plain tuples instead of ORM rows.
+class _SearchProvider(NamedTuple):
+    id: int
+    name: str
+    api_url: str  # base_url already normalised to the Torznab endpoint
+    api_key: str
+
+
+class _SearchMagazine(NamedTuple):
+    id: int
+    title: str
+    regex: Optional[str]
+    language: Optional[str]
+
+
+if LET is not None:
+    _TORZNAB_ATTRS = LET.XPath("newznab:attr", namespaces=NEWZNAB_NS)
+
+# Parameter-free statements built once; SQLAlchemy caches their compiled SQL.
+_SELECT_PROVIDERS = select(Provider)
+# Enabled providers that serve magazines ("M" in download_types).
+_SELECT_MAGAZINE_PROVIDERS = select(Provider.id, Provider.name, Provider.base_url, Provider.api_key).where(
+    Provider.enabled == True,  # noqa: E712
+    func.upper(Provider.download_types).like("%M%"),
+)
+_SELECT_MAGAZINES = select(Magazine)
+_SELECT_SEARCH_MAGAZINES = select(Magazine.id, Magazine.title, Magazine.regex, Magazine.language)
+_SELECT_ACTIVE_MAGAZINES = _SELECT_SEARCH_MAGAZINES.where(Magazine.status == "active")
+_SELECT_SABNZBD_CONFIG = select(SabnzbdConfig).limit(1)
+_SELECT_APP_CONFIG = select(AppConfig).limit(1)
+# The recent-jobs listing feeds DownloadJobRead, which never exposes the NZB link.
+_SELECT_RECENT_DOWNLOAD_JOBS = (
+    select(DownloadJob).options(defer(DownloadJob.link)).order_by(DownloadJob.created_at.desc())
+)
+_SELECT_ACTIVE_DOWNLOAD_JOBS = select(DownloadJob).where(DownloadJob.status.notin_(["failed", "moved"]))
+_SELECT_ANY_ACTIVE_DOWNLOAD_JOB = select(DownloadJob.id).where(DownloadJob.status.notin_(["failed", "moved"])).limit(1)
+_MATCHABLE_JOB_STATUSES = ["pending", "queued", "downloading", "processing", "completed"]
 
 
 # Provider CRUD ----------------------------------------------------------------
 
 def list_providers(session: Session) -> List[Provider]:
-    return list(session.exec(select(Provider)))
+    return list(session.exec(_SELECT_PROVIDERS))
 
 
 def get_provider(session: Session, provider_id: int) -> Optional[Provider]:
@@ -60,7 +134,6 @@ def create_provider(session: Session, payload: ProviderCreate) -> Provider:
     provider.updated_at = now
     session.add(provider)
     session.commit()
-    session.refresh(provider)
     return provider
 
 
@@ -73,7 +146,6 @@ def update_provider(session: Session, provider: Provider, payload: ProviderUpdat
     provider.updated_at = datetime.utcnow()
     session.add(provider)
     session.commit()
-    session.refresh(provider)
     return provider
 
 
@@ -106,7 +178,6 @@ def create_provider_category(session: Session, provider: Provider, payload: Prov
     )
     session.add(category)
     session.commit()
-    session.refresh(category)
     return category
 
 
@@ -123,14 +194,10 @@ def delete_provider_category(session: Session, category: ProviderCategory) -> No
 # Magazine CRUD -----------------------------------------------------------------
 
 def list_magazines(session: Session, status: Optional[str] = None) -> List[Magazine]:
-    statement = select(Magazine)
+    statement = _SELECT_MAGAZINES
     if status:
         statement = statement.where(Magazine.status == status)
-    magazines = list(session.exec(statement))
-    for magazine in magazines:
-        if not getattr(magazine, "language", None):
-            magazine.language = "en"
-    return magazines
+    return list(session.exec(statement))
 
 
 def get_magazine(session: Session, magazine_id: int) -> Optional[Magazine]:
@@ -147,7 +214,6 @@ def create_magazine(session: Session, payload: MagazineCreate) -> Magazine:
     magazine.updated_at = now
     session.add(magazine)
     session.commit()
-    session.refresh(magazine)
     return magazine
 
 
@@ -160,7 +226,6 @@ def update_magazine(session: Session, magazine: Magazine, payload: MagazineUpdat
     magazine.updated_at = datetime.utcnow()
     session.add(magazine)
     session.commit()
-    session.refresh(magazine)
     return magazine
 
 
@@ -170,47 +235,53 @@ def delete_magazine(session: Session, magazine: Magazine) -> None:
 
 
 def list_magazine_category_options(session: Session, magazine: Magazine) -> List[ProviderCategoryOption]:
-    providers = {provider.id: provider for provider in list_providers(session)}
-    statement = select(ProviderCategory).order_by(ProviderCategory.provider_id, ProviderCategory.name)
-    categories = list(session.exec(statement))
-    selected_ids = {
-        item.provider_category_id
-        for item in session.exec(
-            select(MagazineCategorySelection).where(MagazineCategorySelection.magazine_id == magazine.id)
+    # EXISTS rather than an outer join so duplicate selection rows can't duplicate options.
+    selected = (
+        select(MagazineCategorySelection.id)
+        .where(
+            MagazineCategorySelection.magazine_id == magazine.id,
+            MagazineCategorySelection.provider_category_id == ProviderCategory.id,
         )
-    }
-    options: List[ProviderCategoryOption] = []
-    for category in categories:
-        provider = providers.get(category.provider_id)
-        if not provider:
-            continue
-        options.append(
-            ProviderCategoryOption(
-                id=category.id,
-                provider_id=category.provider_id,
-                provider_name=provider.name,
-                code=category.code,
-                name=category.name,
-                selected=category.id in selected_ids,
-            )
+        .exists()
+    )
+    statement = (
+        select(
+            ProviderCategory.id,
+            ProviderCategory.provider_id,
+            Provider.name,
+            ProviderCategory.code,
+            ProviderCategory.name,
+            selected,
+        )
+        .join(Provider, Provider.id == ProviderCategory.provider_id)
+        .order_by(ProviderCategory.provider_id, ProviderCategory.name)
+    )
+    return [
+        ProviderCategoryOption(
+            id=category_id,
+            provider_id=provider_id,
+            provider_name=provider_name,
+            code=code,
+            name=name,
+            selected=is_selected,
         )
-    return options
+        for category_id, provider_id, provider_name, code, name, is_selected in session.exec(statement)
+    ]
 
 
 def set_magazine_categories(session: Session, magazine: Magazine, category_ids: List[int]) -> None:
-    existing_ids = {
-        item.provider_category_id
-        for item in session.exec(
-            select(MagazineCategorySelection).where(MagazineCategorySelection.magazine_id == magazine.id)
+    existing_ids = set(
+        session.exec(
+            select(MagazineCategorySelection.provider_category_id).where(
+                MagazineCategorySelection.magazine_id == magazine.id
+            )
         )
-    }
+    )
     target_ids: Set[int] = set()
     if category_ids:
-        target_ids = {
-            cid
-            for cid in category_ids
-            if session.get(ProviderCategory, cid) is not None
-        }
+        target_ids = set(
+            session.exec(select(ProviderCategory.id).where(ProviderCategory.id.in_(set(category_ids))))
+        )
     to_remove = existing_ids - target_ids
     to_add = target_ids - existing_ids
     if to_remove:
@@ -220,14 +291,20 @@ def set_magazine_categories(session: Session, magazine: Magazine, category_ids:
                 MagazineCategorySelection.provider_category_id.in_(to_remove),
             )
         )
-    now = datetime.utcnow()
-    for category_id in to_add:
-        session.add(
-            MagazineCategorySelection(
-                magazine_id=magazine.id,
-                provider_category_id=category_id,
-                created_at=now,
-                updated_at=now,
+    if to_add:
+        now = datetime.utcnow()
+        # One multi-row INSERT instead of an ORM object and INSERT per selection.
+        session.exec(
+            insert(MagazineCategorySelection).values(
+                [
+                    {
+                        "magazine_id": magazine.id,
+                        "provider_category_id": category_id,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for category_id in to_add
+                ]
             )
         )
     if not to_add and not to_remove:
@@ -235,8 +312,12 @@ def set_magazine_categories(session: Session, magazine: Magazine, category_ids:
     session.commit()
 
 
-def _build_magazine_category_map(session: Session) -> Dict[Tuple[int, int], List[str]]:
-    mapping: Dict[Tuple[int, int], List[str]] = {}
+def _build_magazine_category_map(
+    session: Session,
+    magazine_ids: Iterable[int],
+    provider_ids: Iterable[int],
+) -> Dict[Tuple[int, int], Tuple[str, ...]]:
+    mapping: DefaultDict[Tuple[int, int], Set[str]] = defaultdict(set)
     statement = (
         select(
             MagazineCategorySelection.magazine_id,
@@ -244,45 +325,44 @@ def _build_magazine_category_map(session: Session) -> Dict[Tuple[int, int], List
             ProviderCategory.code,
         )
         .join(ProviderCategory, ProviderCategory.id == MagazineCategorySelection.provider_category_id)
+        .where(
+            MagazineCategorySelection.magazine_id.in_(set(magazine_ids)),
+            ProviderCategory.provider_id.in_(set(provider_ids)),
+        )
     )
     for magazine_id, provider_id, code in session.exec(statement):
-        key = (magazine_id, provider_id)
-        mapping.setdefault(key, []).append(code)
-    return mapping
+        mapping[(magazine_id, provider_id)].add(code)
+    # Sorted tuples double as the grouping key in search_magazines and the request's cat value.
+    return {key: tuple(sorted(codes)) for key, codes in mapping.items()}
 
 
 # Search ------------------------------------------------------------------------
 
-def _safe_int(value) -> int:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return 0
-
-
 def _result_sort_key(result: SearchResult) -> tuple:
+    # Issue fields are validated Optional[int] on SearchResult, so "or 0" is enough.
     if result.issue_year:
-        year = _safe_int(result.issue_year)
-        month = _safe_int(result.issue_month)
-        day = _safe_int(result.issue_day)
-        issue_num = _safe_int(result.issue_number)
         published_ts = int(result.published.timestamp()) if result.published else 0
-        return (year, month, day, issue_num, published_ts)
+        return (
+            result.issue_year,
+            result.issue_month or 0,
+            result.issue_day or 0,
+            result.issue_number or 0,
+            published_ts,
+        )
     if result.published:
         published = result.published
         published_ts = int(published.timestamp())
         return (published.year, published.month, published.day, 0, published_ts)
-    issue_num = _safe_int(result.issue_number)
-    return (0, 0, 0, issue_num, 0)
+    return (0, 0, 0, result.issue_number or 0, 0)
 
 
-def _build_search_term(magazine: Magazine) -> str:
+def _build_search_term(magazine: _SearchMagazine) -> str:
     if magazine.regex:
         return magazine.regex
     return magazine.title
 
 
-def _iter_search_terms(magazines: Iterable[Magazine]) -> Iterable[Tuple[Magazine, str]]:
+def _iter_search_terms(magazines: Iterable[_SearchMagazine]) -> Iterable[Tuple[_SearchMagazine, str]]:
     for magazine in magazines:
         term = _build_search_term(magazine)
         if term:
@@ -296,70 +376,178 @@ async def search_magazines(
     """Fetch NZB results for magazines using enabled Torznab/Newznab providers."""
 
     settings = get_settings()
-    providers = session.exec(
-        select(Provider).where(Provider.enabled == True)  # noqa: E712
-    ).all()
+    providers = [
+        _SearchProvider(provider_id, name, _normalise_provider_url(base_url), api_key)
+        for provider_id, name, base_url, api_key in session.exec(_SELECT_MAGAZINE_PROVIDERS)
+    ]
+    if not providers:
+        return []
 
+    statement = _SELECT_ACTIVE_MAGAZINES
     if titles:
-        magazines = session.exec(
-            select(Magazine).where(Magazine.title.in_(titles), Magazine.status == "active")
-        ).all()
-    else:
-        magazines = session.exec(select(Magazine).where(Magazine.status == "active")).all()
+        statement = statement.where(Magazine.title.in_(titles))
+    magazines = [_SearchMagazine(*row) for row in session.exec(statement)]
 
-    if not magazines or not providers:
+    if not magazines:
         return []
 
-    category_map = _build_magazine_category_map(session)
+    # Only the selections of the magazines and providers this run will query.
+    category_map = _build_magazine_category_map(
+        session,
+        (magazine.id for magazine in magazines),
+        (provider.id for provider in providers),
+    )
 
-    async with httpx.AsyncClient(timeout=settings.torznab_timeout) as client:
-        tasks = []
-        for provider in providers:
-            if "M" not in provider.download_types.upper():
-                continue
-            for magazine, term in _iter_search_terms(magazines):
-                categories = None
-                if magazine.id is not None:
-                    categories = category_map.get((magazine.id, provider.id))
-                tasks.append(_query_provider(client, provider, magazine, term, categories))
+    # Each provider is drained by a few long-lived workers rather than one task per
+    # (provider, magazine) pair: each host sees a bounded number of requests at a time,
+    # keep-alive connections get reused, and a global cap limits the total in flight.
+    global_slots = asyncio.Semaphore(settings.torznab_global_concurrency)
+    client = get_search_client()
+    raw_results: List[Optional[List[SearchResult]]] = []
+    parsed: _ParseCache = {}
+    max_age_days = settings.torznab_max_age_days
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days) if max_age_days else None
+
+    async def _drain(
+        queries: Iterator[Tuple[int, _SearchProvider, List[_SearchMagazine], str, Optional[Tuple[str, ...]]]],
+    ) -> None:
+        for index, provider, owners, term, categories in queries:
+            async with global_slots:
+                try:
+                    raw_results[index] = await _query_provider(
+                        client, provider, owners, term, categories, parsed, cutoff
+                    )
+                except Exception:
+                    continue
 
-        raw_results = await asyncio.gather(*tasks, return_exceptions=True)
+    search_terms = list(_iter_search_terms(magazines))
+    workers = []
+    for provider in providers:
+        # Magazines that resolve to the same term and categories share one request.
+        grouped: Dict[Tuple[str, Optional[Tuple[str, ...]]], List[_SearchMagazine]] = {}
+        for magazine, term in search_terms:
+            categories = category_map.get((magazine.id, provider.id))
+            grouped.setdefault((term, categories), []).append(magazine)
+        queries = []
+        for (term, categories), owners in grouped.items():
+            queries.append((len(raw_results), provider, owners, term, categories))
+            raw_results.append(None)
+        shared = iter(queries)
+        for _ in range(min(settings.torznab_per_provider_concurrency, len(queries))):
+            workers.append(_drain(shared))
+
+    await asyncio.gather(*workers)
 
     results: List[SearchResult] = []
-    max_age_days = settings.torznab_max_age_days
-    max_age = timedelta(days=max_age_days) if max_age_days else None
     for item in raw_results:
-        if isinstance(item, Exception):
-            continue
-        for result in item:
-            if max_age and result.published:
-                if datetime.utcnow() - result.published > max_age:
-                    continue
-            results.append(result)
+        if item:
+            results.extend(item)
     if results:
         results.sort(key=_result_sort_key, reverse=True)
     return results
 
 
+def get_search_client() -> httpx.AsyncClient:
+    """Return the process-wide client used for provider searches, keeping TLS sessions warm."""
+    global _search_client
+    if _search_client is None or _search_client.is_closed:
+        _search_client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=get_settings().torznab_timeout,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128, keepalive_expiry=30),
+        )
+    return _search_client
+
+
+async def close_search_client() -> None:
+    global _search_client
+    if _search_client is not None:
+        await _search_client.aclose()
+        _search_client = None
+
+
 async def _query_provider(
     client: httpx.AsyncClient,
-    provider: Provider,
-    magazine: Magazine,
+    provider: _SearchProvider,
+    magazines: List[_SearchMagazine],
     term: str,
-    categories: Optional[List[str]] = None,
+    categories: Optional[Tuple[str, ...]] = None,
+    parsed: Optional[_ParseCache] = None,
+    cutoff: Optional[datetime] = None,
 ) -> List[SearchResult]:
-    params = {"apikey": provider.api_key, "t": "search", "q": term}
-    if categories:
-        params["cat"] = ",".join(sorted(set(categories)))
-    url = _normalise_provider_url(provider.base_url)
-    response = await client.get(url, params=params)
-    response.raise_for_status()
-    return _parse_torznab_response(
-        provider.name,
-        response.text,
-        magazine_title=magazine.title,
-        magazine_language=magazine.language or "en",
-    )
+    entries = await _fetch_provider_entries(client, provider, term, categories)
+    if cutoff is not None:
+        # Drop releases past torznab_max_age_days before their titles are parsed.
+        entries = [entry for entry in entries if entry[2] is None or entry[2] >= cutoff]
+    titles = [entry[0] for entry in entries]
+    if parsed is None:
+        parsed = {}
+    results: List[SearchResult] = []
+    for magazine in magazines:
+        language = magazine.language or "en"
+        known = parsed.setdefault((magazine.title, language), {})
+        # Providers often return the same releases; only parse titles this run hasn't seen.
+        missing = list(dict.fromkeys(title for title in titles if title not in known))
+        if missing:
+            known.update(zip(missing, await _parse_issues_off_loop(missing, magazine.title, language)))
+        metadatas = [known[title] for title in titles]
+        results.extend(_build_search_results(provider.name, entries, metadatas, magazine.title))
+    return results
+
+
+async def _fetch_provider_entries(
+    client: httpx.AsyncClient,
+    provider: _SearchProvider,
+    term: str,
+    categories: Optional[Tuple[str, ...]] = None,
+) -> List[_TorznabEntry]:
+    url = provider.api_url
+    cat = ",".join(categories) if categories else None
+    key = (url, provider.api_key, term, cat)
+    settings = get_settings()
+    ttl = settings.torznab_cache_seconds
+    cached = _search_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    pending = _search_inflight.get(key)
+    if pending is not None:
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            # Only the leader was cancelled: fetch again rather than failing this search too.
+            if not pending.cancelled() or asyncio.current_task().cancelling():
+                raise
+        return await _fetch_provider_entries(client, provider, term, categories)
+
+    future: "asyncio.Future[List[_TorznabEntry]]" = asyncio.get_running_loop().create_future()
+    _search_inflight[key] = future
+    try:
+        params = {"apikey": provider.api_key, "t": "search", "q": term}
+        if cat:
+            params["cat"] = cat
+        # Per request, so a reloaded torznab_timeout applies to the shared client too.
+        response = await client.get(url, params=params, timeout=settings.torznab_timeout)
+        response.raise_for_status()
+        entries = _extract_torznab_entries(response.content)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved when nobody else was waiting
+        raise
+    else:
+        future.set_result(entries)
+    finally:
+        _search_inflight.pop(key, None)
+
+    if ttl > 0:
+        now = time.monotonic()
+        for stale in [k for k, (stored_at, _) in _search_cache.items() if now - stored_at >= ttl]:
+            del _search_cache[stale]
+        _search_cache[key] = (now, entries)
+    return entries
 
 
 def _normalise_provider_url(base_url: str) -> str:
@@ -370,35 +558,89 @@ def _normalise_provider_url(base_url: str) -> str:
     return f"{base_url}/api"
 
 
-def _parse_torznab_response(
-    provider_name: str,
-    xml_payload: str,
-    magazine_title: Optional[str] = None,
-    magazine_language: str = "en",
-) -> List[SearchResult]:
+def _torznab_items(xml_payload: Union[str, bytes]) -> Iterator[Any]:
+    if isinstance(xml_payload, str):
+        # lxml refuses str input that carries an encoding declaration.
+        xml_payload = xml_payload.encode("utf-8")
+    # Stream items and free each one once the caller is done with it, so peak
+    # memory stays around one item instead of the whole feed.
+    if LET is None:
+        yield from _stdlib_torznab_items(xml_payload)
+        return
+
+    events = LET.iterparse(
+        BytesIO(xml_payload),
+        events=("end",),
+        tag="item",
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=False,
+    )
     try:
-        root = ET.fromstring(xml_payload)
+        for _, item in events:
+            channel = item.getparent()
+            root = channel.getparent() if channel is not None else None
+            if channel is None or channel.tag != "channel" or root is None or root.getparent() is not None:
+                continue  # only ./channel/item, like the tree-based path
+            yield item
+            item.clear()
+            while item.getprevious() is not None:
+                del channel[0]
+    except LET.XMLSyntaxError:
+        return
+
+
+def _stdlib_torznab_items(xml_payload: bytes) -> Iterator[Any]:
+    open_elements: List[Any] = []
+    try:
+        for event, element in ET.iterparse(BytesIO(xml_payload), events=("start", "end")):
+            if event == "start":
+                open_elements.append(element)
+                continue
+            open_elements.pop()
+            # only ./channel/item, like the lxml path
+            if element.tag != "item" or len(open_elements) != 2 or open_elements[1].tag != "channel":
+                continue
+            yield element
+            open_elements[1].remove(element)
     except ET.ParseError:
-        return []
+        return
 
-    results: List[SearchResult] = []
-    for item in root.findall("./channel/item"):
+
+def _torznab_attrs(item: Any) -> List[Any]:
+    if LET is not None:
+        return _TORZNAB_ATTRS(item)
+    return item.findall(_NEWZNAB_ATTR_TAG)
+
+
+@lru_cache(maxsize=4096)
+def _parse_pubdate(pub_text: str) -> Optional[datetime]:
+    # Cached: items in a feed (and repeat searches) share many identical pubDate strings.
+    try:
+        published = parsedate_to_datetime(pub_text)
+    except (TypeError, ValueError):
+        return None
+    if published.tzinfo is None:
+        # "-0000" zones parse as naive; keep every timestamp aware UTC.
+        published = published.replace(tzinfo=timezone.utc)
+    return published
+
+
+def _extract_torznab_entries(xml_payload: Union[str, bytes]) -> List[_TorznabEntry]:
+    entries: List[_TorznabEntry] = []
+    for item in _torznab_items(xml_payload):
         title = item.findtext("title")
         link = item.findtext("link")
         if not title or not link:
             continue
 
-        published = None
         pub_text = item.findtext("pubDate")
-        if pub_text:
-            try:
-                published = parsedate_to_datetime(pub_text)
-            except (TypeError, ValueError):
-                published = None
+        published = _parse_pubdate(pub_text) if pub_text else None
 
         size = None
         categories: List[str] = []
-        for attr in item.findall("newznab:attr", NEWZNAB_NS):
+        for attr in _torznab_attrs(item):
             name = attr.attrib.get("name")
             value = attr.attrib.get("value")
             if not name or value is None:
@@ -411,7 +653,54 @@ def _parse_torznab_response(
             elif name == "category":
                 categories.append(value)
 
-        metadata = parse_issue(title, magazine_title, language=magazine_language)
+        entries.append((title, link, published, size, categories))
+    return entries
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        # spawn: forking a process that already runs the event loop's threads is unsafe.
+        _PARSE_POOL = ProcessPoolExecutor(
+            max_workers=min(_PARSE_POOL_MAX_WORKERS, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _PARSE_POOL
+
+
+def shutdown_parse_pool() -> None:
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(wait=False, cancel_futures=True)
+        _PARSE_POOL = None
+
+
+async def _parse_issues_off_loop(
+    titles: List[str],
+    magazine_title: Optional[str],
+    magazine_language: str,
+) -> List[Optional[IssueMetadata]]:
+    if len(titles) < _PARSE_POOL_MIN_BATCH:
+        return parse_issues(titles, magazine_title, magazine_language)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            _get_parse_pool(), parse_issues, titles, magazine_title, magazine_language
+        )
+    except BrokenProcessPool:
+        logger.warning("Issue parser pool broke; parsing inline.")
+        shutdown_parse_pool()
+        return parse_issues(titles, magazine_title, magazine_language)
+
+
+def _build_search_results(
+    provider_name: str,
+    entries: List[_TorznabEntry],
+    metadatas: List[Optional[IssueMetadata]],
+    magazine_title: Optional[str],
+) -> List[SearchResult]:
+    results: List[SearchResult] = []
+    for (title, link, published, size, categories), metadata in zip(entries, metadatas):
         result = SearchResult(
             provider=provider_name,
             title=title,
@@ -442,13 +731,13 @@ def _clean_optional_str(value: Optional[str]) -> Optional[str]:
 
 
 def get_sabnzbd_config(session: Session) -> SabnzbdConfig:
-    config = session.exec(select(SabnzbdConfig).limit(1)).first()
+    config = session.exec(_SELECT_SABNZBD_CONFIG).first()
     if config:
         return config
     settings = get_settings()
     now = datetime.utcnow()
     config = SabnzbdConfig(
-        base_url=_clean_optional_str(settings.sabnzbd_url),
+        base_url=settings.sabnzbd_url,
         api_key=_clean_optional_str(settings.sabnzbd_api_key),
         category=_clean_optional_str(settings.sabnzbd_category),
         priority=settings.sabnzbd_priority,
@@ -461,11 +750,10 @@ def get_sabnzbd_config(session: Session) -> SabnzbdConfig:
         session.commit()
     except IntegrityError:
         session.rollback()
-        config = session.exec(select(SabnzbdConfig).limit(1)).first()
+        config = session.exec(_SELECT_SABNZBD_CONFIG).first()
         if config:
             return config
         raise
-    session.refresh(config)
     return config
 
 
@@ -486,7 +774,6 @@ def update_sabnzbd_config(session: Session, payload: SabnzbdConfigUpdate) -> Sab
     config.updated_at = datetime.utcnow()
     session.add(config)
     session.commit()
-    session.refresh(config)
     return config
 
 
@@ -505,13 +792,8 @@ def get_sabnzbd_connection(session: Session, config: Optional[SabnzbdConfig] = N
 
 
 def get_app_config(session: Session) -> AppConfig:
-    config = session.exec(select(AppConfig).limit(1)).first()
+    config = session.exec(_SELECT_APP_CONFIG).first()
     if config:
-        if _normalize_auto_download_interval(config):
-            config.updated_at = datetime.utcnow()
-            session.add(config)
-            session.commit()
-            session.refresh(config)
         _apply_app_config_defaults(config)
         return config
     settings = get_settings()
@@ -528,7 +810,6 @@ def get_app_config(session: Session) -> AppConfig:
     )
     session.add(config)
     session.commit()
-    session.refresh(config)
     _apply_app_config_defaults(config)
     return config
 
@@ -541,12 +822,6 @@ def update_app_config(session: Session, payload: AppConfigUpdate) -> AppConfig:
     config.updated_at = datetime.utcnow()
     session.add(config)
     session.commit()
-    session.refresh(config)
-    if _normalize_auto_download_interval(config):
-        config.updated_at = datetime.utcnow()
-        session.add(config)
-        session.commit()
-        session.refresh(config)
     _apply_app_config_defaults(config)
     return config
 
@@ -565,26 +840,16 @@ def _apply_app_config_defaults(config: AppConfig) -> None:
         config.debug_logging = settings.debug_logging
 
 
-def _normalize_auto_download_interval(config: AppConfig) -> bool:
-    interval = config.auto_download_interval
-    if interval is None:
-        return False
-    if interval > 48:
-        config.auto_download_interval = round(interval / 3600.0, 4)
-        return True
-    return False
-
-
 # Download jobs ----------------------------------------------------------------
 
-def get_download_job_by_nzo(session: Session, nzo_id: str) -> Optional[DownloadJob]:
-    return session.exec(select(DownloadJob).where(DownloadJob.sabnzbd_id == nzo_id)).first()
+def _new_download_job(nzo_id: Optional[str], now: datetime, **fields) -> DownloadJob:
+    return DownloadJob(sabnzbd_id=nzo_id, created_at=now, updated_at=now, **fields)
 
 
-def upsert_download_job(
-    session: Session,
+def _merge_download_job(
+    job: DownloadJob,
+    now: datetime,
     *,
-    nzo_id: Optional[str],
     title: Optional[str],
     magazine_title: Optional[str],
     link: Optional[str],
@@ -594,31 +859,7 @@ def upsert_download_job(
     issue_year: Optional[int] = None,
     issue_month: Optional[int] = None,
     issue_number: Optional[int] = None,
-) -> DownloadJob:
-    now = datetime.utcnow()
-    job: Optional[DownloadJob] = None
-    if nzo_id:
-        job = get_download_job_by_nzo(session, nzo_id)
-    if not job:
-        job = DownloadJob(
-            sabnzbd_id=nzo_id,
-            title=title,
-            magazine_title=magazine_title,
-            link=link,
-            status=status,
-            issue_code=issue_code,
-            issue_label=issue_label,
-            issue_year=issue_year,
-            issue_month=issue_month,
-            issue_number=issue_number,
-            created_at=now,
-            updated_at=now,
-        )
-        session.add(job)
-        session.commit()
-        session.refresh(job)
-        return job
-
+) -> None:
     changed = False
     if title and job.title != title:
         job.title = title
@@ -651,10 +892,63 @@ def upsert_download_job(
     if changed:
         job.updated_at = now
 
-    session.add(job)
+
+def upsert_download_jobs(
+    session: Session,
+    nzo_ids: Iterable[str],
+    *,
+    title: Optional[str],
+    magazine_title: Optional[str],
+    link: Optional[str],
+    status: str = "pending",
+    issue_code: Optional[str] = None,
+    issue_label: Optional[str] = None,
+    issue_year: Optional[int] = None,
+    issue_month: Optional[int] = None,
+    issue_number: Optional[int] = None,
+) -> List[DownloadJob]:
+    """Upsert one job per SABnzbd id sharing the same metadata, with one lookup and one commit."""
+    nzo_ids = list(nzo_ids)
+    now = datetime.utcnow()
+    fields = dict(
+        title=title,
+        magazine_title=magazine_title,
+        link=link,
+        status=status,
+        issue_code=issue_code,
+        issue_label=issue_label,
+        issue_year=issue_year,
+        issue_month=issue_month,
+        issue_number=issue_number,
+    )
+    known: Dict[str, DownloadJob] = {}
+    wanted = [nzo_id for nzo_id in nzo_ids if nzo_id]
+    if wanted:
+        rows = session.exec(
+            select(DownloadJob).where(DownloadJob.sabnzbd_id.in_(wanted)).order_by(DownloadJob.id)
+        ).all()
+        for row in rows:
+            known.setdefault(row.sabnzbd_id, row)
+
+    jobs: List[DownloadJob] = []
+    for nzo_id in nzo_ids:
+        job = known.get(nzo_id) if nzo_id else None
+        if job:
+            _merge_download_job(job, now, **fields)
+        else:
+            job = _new_download_job(nzo_id, now, **fields)
+            if nzo_id:
+                known[nzo_id] = job
+        session.add(job)
+        jobs.append(job)
     session.commit()
-    session.refresh(job)
-    return job
+    return jobs
+
+
+# Fields an update only overwrites with a non-empty value; the rest accept any non-None value.
+_JOB_FIELDS_SET_IF_TRUTHY = frozenset(
+    {"status", "content_name", "completed_at", "clean_name", "thumbnail_path", "staging_path"}
+)
 
 
 def update_download_job_status(
@@ -677,104 +971,80 @@ def update_download_job_status(
     issue_year: Optional[int] = None,
     issue_month: Optional[int] = None,
     issue_number: Optional[int] = None,
+    commit: bool = True,
 ) -> DownloadJob:
     now = datetime.utcnow()
+    changes = {
+        "status": status,
+        "sab_status": sab_status,
+        "progress": progress,
+        "time_remaining": time_remaining,
+        "message": message,
+        "content_name": content_name,
+        "completed_at": completed_at,
+        "clean_name": clean_name,
+        "thumbnail_path": thumbnail_path,
+        "staging_path": staging_path,
+        "magazine_title": magazine_title,
+        "issue_code": issue_code,
+        "issue_label": issue_label,
+        "issue_year": issue_year,
+        "issue_month": issue_month,
+        "issue_number": issue_number,
+    }
     updated = False
-
-    if status and job.status != status:
-        job.status = status
-        updated = True
-    if sab_status is not None and job.sab_status != sab_status:
-        job.sab_status = sab_status
-        updated = True
-    if progress is not None and job.progress != progress:
-        job.progress = progress
-        updated = True
-    if time_remaining is not None and job.time_remaining != time_remaining:
-        job.time_remaining = time_remaining
-        updated = True
-    if message is not None and job.message != message:
-        job.message = message
-        updated = True
-    if content_name and job.content_name != content_name:
-        job.content_name = content_name
-        updated = True
-    if completed_at and job.completed_at != completed_at:
-        job.completed_at = completed_at
-        updated = True
-    if clean_name and job.clean_name != clean_name:
-        job.clean_name = clean_name
-        updated = True
-    if thumbnail_path and job.thumbnail_path != thumbnail_path:
-        job.thumbnail_path = thumbnail_path
-        updated = True
-    if staging_path and job.staging_path != staging_path:
-        job.staging_path = staging_path
-        updated = True
-    if magazine_title is not None and job.magazine_title != magazine_title:
-        job.magazine_title = magazine_title
-        updated = True
-    if issue_code is not None and job.issue_code != issue_code:
-        job.issue_code = issue_code
-        updated = True
-    if issue_label is not None and job.issue_label != issue_label:
-        job.issue_label = issue_label
-        updated = True
-    if issue_year is not None and job.issue_year != issue_year:
-        job.issue_year = issue_year
-        updated = True
-    if issue_month is not None and job.issue_month != issue_month:
-        job.issue_month = issue_month
-        updated = True
-    if issue_number is not None and job.issue_number != issue_number:
-        job.issue_number = issue_number
-        updated = True
+    for field, value in changes.items():
+        if value is None or (field in _JOB_FIELDS_SET_IF_TRUTHY and not value):
+            continue
+        if getattr(job, field) != value:
+            setattr(job, field, value)
+            updated = True
 
     if updated:
         job.last_seen = now
         job.updated_at = now
 
     session.add(job)
-    session.commit()
-    session.refresh(job)
+    if commit:
+        session.commit()
     return job
 
 
-def mark_download_job_failed(session: Session, job: DownloadJob, message: Optional[str] = None) -> DownloadJob:
+def mark_download_job_failed(
+    session: Session,
+    job: DownloadJob,
+    message: Optional[str] = None,
+    commit: bool = True,
+) -> DownloadJob:
     return update_download_job_status(
         session,
         job,
         status="failed",
         sab_status="Failed",
         message=message,
+        commit=commit,
     )
 
 
 def find_download_job_for_entry(session: Session, entry_name: str) -> Optional[DownloadJob]:
-    entry_name = entry_name.strip()
-    normalized_entry = entry_name.lower()
-    candidates = session.exec(
-        select(DownloadJob).where(
-            DownloadJob.status.in_(["pending", "queued", "downloading", "processing", "completed"])
+    stem = match_stem(entry_name)
+    if not stem:
+        return None
+    # The stem columns are indexed, so this is a lookup rather than a scan of every active job.
+    statement = (
+        select(DownloadJob)
+        .where(
+            DownloadJob.status.in_(_MATCHABLE_JOB_STATUSES),
+            or_(
+                DownloadJob.clean_stem == stem,
+                DownloadJob.content_stem == stem,
+                DownloadJob.title_stem == stem,
+            ),
         )
-    ).all()
-
-    for candidate in candidates:
-        compare_targets = [
-            candidate.clean_name or "",
-            candidate.content_name or "",
-            candidate.title or "",
-        ]
-        for target in compare_targets:
-            compare = target.strip().lower()
-            if compare and compare == normalized_entry:
-                return candidate
-            if compare and Path(compare).stem == Path(normalized_entry).stem:
-                return candidate
-        if candidate.title:
-            if Path(candidate.title).stem.lower() == Path(entry_name).stem.lower():
-                return candidate
-    return None
+        .order_by(DownloadJob.id)
+        .limit(1)
+    )
+    return session.exec(statement).first()
 
 
 def mark_download_job_moved(session: Session, job: DownloadJob, destination: Path) -> DownloadJob:
@@ -788,12 +1058,11 @@ def mark_download_job_moved(session: Session, job: DownloadJob, destination: Pat
     job.staging_path = None
     session.add(job)
     session.commit()
-    session.refresh(job)
     return job
 
 
 def list_recent_download_jobs(session: Session, limit: int = 50) -> List[DownloadJob]:
-    statement = select(DownloadJob).order_by(DownloadJob.created_at.desc()).limit(limit)
+    statement = _SELECT_RECENT_DOWNLOAD_JOBS.limit(limit)
     return list(session.exec(statement))
 
 
@@ -805,8 +1074,26 @@ def list_active_download_jobs(session: Session) -> List[DownloadJob]:
     omitted; every other status (including unexpected SAB strings such as
     "extracting") stays in the active set so tracker updates keep flowing.
     """
-    statement = select(DownloadJob).where(DownloadJob.status.notin_(["failed", "moved"]))
-    return list(session.exec(statement))
+    return list(session.exec(_SELECT_ACTIVE_DOWNLOAD_JOBS))
+
+
+def has_active_download_jobs(session: Session) -> bool:
+    return session.exec(_SELECT_ANY_ACTIVE_DOWNLOAD_JOB).first() is not None
+
+
+_PURGE_WORKERS = 8
+
+
+def _remove_download_artifact(entry: Path) -> bool:
+    try:
+        if entry.is_dir():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+        return True
+    except Exception:
+        logger.exception("Failed removing download artifact: %s", entry)
+        return False
 
 
 def _purge_directory_contents(path: Optional[Path]) -> int:
@@ -815,19 +1102,12 @@ def _purge_directory_contents(path: Optional[Path]) -> int:
     directory = path.expanduser()
     if not directory.exists():
         return 0
-    removed = 0
-    for entry in directory.iterdir():
-        if entry.name.startswith("."):
-            continue
-        try:
-            if entry.is_dir():
-                shutil.rmtree(entry)
-            else:
-                entry.unlink()
-            removed += 1
-        except Exception:
-            logger.exception("Failed removing download artifact: %s", entry)
-    return removed
+    entries = [entry for entry in directory.iterdir() if not entry.name.startswith(".")]
+    if len(entries) <= 1:
+        return sum(_remove_download_artifact(entry) for entry in entries)
+    # Removal is bound by filesystem latency, so independent entries go in parallel.
+    with ThreadPoolExecutor(max_workers=min(_PURGE_WORKERS, len(entries))) as pool:
+        return sum(pool.map(_remove_download_artifact, entries))
 
 
 def clear_download_jobs(session: Session) -> int:
@@ -850,3 +1130,11 @@ def clear_download_jobs(session: Session) -> int:
 def delete_download_job(session: Session, job: DownloadJob) -> None:
     session.delete(job)
     session.commit()
+
+
+def warm_query_cache(session: Session) -> None:
+    """Run the dashboard's hot read queries once so their SQL is compiled before the first request."""
+    list_providers(session)
+    list_magazines(session)
+    list_recent_download_jobs(session)
+    list_active_download_jobs(session)
@@ -1,21 +1,32 @@
+import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field, HttpUrl
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import make_url
 
+from .types import HttpUrlStr
+
+_ENV_FILE = ".env"
+# Opt-in: re-read settings when .env changes, at the cost of one stat() per lookup.
+_WATCH_ENV_FILE = os.environ.get("GAZARR_ENV_WATCH", "").lower() in {"1", "true", "yes"}
 
 class Settings(BaseSettings):
     """Application configuration."""
 
-    model_config = SettingsConfigDict(env_file=".env", env_prefix="GAZARR_", case_sensitive=False)
+    # Frozen: the cached instance is shared process-wide, so nothing may mutate it.
+    model_config = SettingsConfigDict(env_file=_ENV_FILE, env_prefix="GAZARR_", case_sensitive=False, frozen=True)
 
     app_name: str = "Gazarr"
     database_url: str = Field(default="sqlite:///data/app.db")
     torznab_timeout: int = Field(default=15, description="HTTP timeout for Torznab requests (seconds).")
     torznab_max_age_days: Optional[int] = Field(default=None, description="Discard results older than N days.")
-    sabnzbd_url: Optional[HttpUrl] = Field(default=None, description="Base URL for SABnzbd (eg. http://localhost:8080/sabnzbd)")
+    torznab_per_provider_concurrency: int = Field(default=4, ge=1, description="Maximum concurrent searches against a single provider.")
+    torznab_global_concurrency: int = Field(default=32, ge=1, description="Maximum concurrent provider searches overall.")
+    torznab_cache_seconds: float = Field(default=60.0, ge=0, description="Reuse identical provider search responses for this long (0 disables).")
+    sabnzbd_url: Optional[HttpUrlStr] = Field(default=None, description="Base URL for SABnzbd (eg. http://localhost:8080/sabnzbd)")
     sabnzbd_api_key: Optional[str] = Field(default=None, description="SABnzbd API key.")
     sabnzbd_category: Optional[str] = Field(default=None, description="Optional SABnzbd category to use.")
     sabnzbd_priority: Optional[int] = Field(default=None, description="Optional SABnzbd priority (-1,0,1,2).")
@@ -37,40 +48,62 @@ class Settings(BaseSettings):
         description="Maximum NZBs enqueued per scan in the auto downloader.",
     )
     auto_fail_enabled: bool = Field(default=False, description="Automatically fail SABnzbd jobs that appear stuck.")
-    auto_fail_minutes: float = Field(default=720.0, description="Minutes before a stuck job is automatically failed.")
+    # Declared before auto_fail_minutes so its validator can fall back to it.
     legacy_auto_fail_hours: Optional[float] = Field(
         default=None,
         alias="auto_fail_hours",
         exclude=True,
         description="Deprecated: use AUTO_FAIL_MINUTES instead.",
     )
+    auto_fail_minutes: float = Field(default=720.0, description="Minutes before a stuck job is automatically failed.")
     auth_username: Optional[str] = Field(default=None, description="HTTP basic auth username required for API access.")
     auth_password: Optional[str] = Field(default=None, description="HTTP basic auth password required for API access.")
 
     def ensure_sqlite_directory(self) -> None:
-        if self.database_url.startswith("sqlite"):
-            db_path = self.database_url.split("///")[-1]
-            path = Path(db_path).expanduser()
-            if path.parent and not path.parent.exists():
-                path.parent.mkdir(parents=True, exist_ok=True)
-
-    def ensure_library_directory(self) -> None:
-        for folder in (self.library_dir, self.staging_dir, self.covers_dir):
-            if folder:
-                path = folder.expanduser()
-                path.mkdir(parents=True, exist_ok=True)
-
-    def model_post_init(self, __context) -> None:
-        if (self.auto_fail_minutes is None or self.auto_fail_minutes <= 0) and self.legacy_auto_fail_hours:
-            self.auto_fail_minutes = self.legacy_auto_fail_hours * 60
-        if self.auto_download_interval and self.auto_download_interval > 48:
+        if not self.database_url.startswith("sqlite"):
+            return
+        # make_url keeps relative paths relative and drops any ?query; mkdir(exist_ok) needs no exists() probe.
+        database = make_url(self.database_url).database
+        if database and database != ":memory:":
+            Path(database).expanduser().parent.mkdir(parents=True, exist_ok=True)
+
+    @field_validator("downloads_dir", "library_dir", "staging_dir", "covers_dir")
+    @classmethod
+    def _expand_directory(cls, value: Optional[Path]) -> Optional[Path]:
+        # Expand once here so consumers can use the paths as-is.
+        return value.expanduser() if value else value
+
+    @field_validator("auto_fail_minutes")
+    @classmethod
+    def _fallback_to_legacy_hours(cls, value: float, info: ValidationInfo) -> float:
+        legacy_hours = info.data.get("legacy_auto_fail_hours")
+        if value <= 0 and legacy_hours:
+            return legacy_hours * 60
+        return value
+
+    @field_validator("auto_download_interval")
+    @classmethod
+    def _interval_in_hours(cls, value: float) -> float:
+        if value and value > 48:
             # Legacy values were stored as seconds; convert anything implausibly large into hours.
-            self.auto_download_interval = round(self.auto_download_interval / 3600.0, 4)
+            return round(value / 3600.0, 4)
+        return value
+
+
+@lru_cache(maxsize=2)
+def _load_settings(env_mtime_ns: int) -> Settings:
+    # Directories are created by their users: the database module for SQLite and the
+    # download monitor for the library folders, so CLI entry points create nothing extra.
+    return Settings()
+
+
+def _env_mtime_ns() -> int:
+    try:
+        return os.stat(_ENV_FILE).st_mtime_ns
+    except OSError:
+        return 0
 
 
-@lru_cache
 def get_settings() -> Settings:
-    settings = Settings()
-    settings.ensure_sqlite_directory()
-    settings.ensure_library_directory()
-    return settings
+    # Keyed on the .env mtime when watching, so an edit triggers exactly one re-parse.
+    return _load_settings(_env_mtime_ns() if _WATCH_ENV_FILE else 0)
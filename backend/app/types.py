@@ -0,0 +1,19 @@
+"""Annotated field types shared by the API schemas and the settings model."""
+
+from typing import Annotated
+from urllib.parse import urlsplit
+
+from pydantic import AfterValidator, StringConstraints
+
+
+def _check_http_url(value: str) -> str:
+    parts = urlsplit(value)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        raise ValueError("URL must be an absolute http(s) URL")
+    return value
+
+
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+LanguageCode = Annotated[str, StringConstraints(strip_whitespace=True, min_length=2, max_length=5)]
+# Cheap scheme/host check for URLs that are only stored or forwarded as-is.
+HttpUrlStr = Annotated[str, StringConstraints(strip_whitespace=True), AfterValidator(_check_http_url)]